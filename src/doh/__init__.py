@@ -3,12 +3,30 @@ DOH - Delta-Oriented Historykeeper
 A smart auto-commit monitoring system for git repositories.
 """
 
+from importlib import import_module
+
 __version__ = "2.0.0"
 __author__ = "Jeff Blake"
 __email__ = "jeffrey.s.blake@gmail.com"
 
-from .core import DohCore
-from .config import DohConfig
-from .git_stats import GitStats
-
 __all__ = ["DohCore", "DohConfig", "GitStats"]
+
+# Re-exports resolve on first access, so `import doh` (e.g. to read
+# __version__) does not load the config and git machinery
+_EXPORTS = {
+    "DohCore": ".core",
+    "DohConfig": ".config",
+    "GitStats": ".git_stats",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
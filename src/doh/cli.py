@@ -14,31 +14,30 @@ This refactored version separates concerns into dedicated modules:
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 import click
 
-from .core import DohCore
 from .config import DEFAULT_THRESHOLD
-from .git_stats import GitStats
 from .colors import Colors
-from .status_display import show_single_directory_status
-from .git_operations import force_commit_directory
-from .command_handlers import (
-    handle_add_command,
-    handle_remove_command,
-    handle_list_command,
-    handle_status_command,
-    handle_exclusions_add_command,
-    handle_exclusions_remove_command,
-    handle_exclusions_list_command,
-    handle_config_command,
-    handle_run_command,
-    handle_squash_command,
-    handle_cleanup_command,
-)
 
+if TYPE_CHECKING:
+    from .core import DohCore
+
+# DohCore, GitStats and the command handlers are imported inside each
+# command, so an invocation only loads the modules it runs and
+# --help/--version load none of them
+
+_doh = None
 
-# Initialize core
-doh = DohCore()
+
+def get_doh() -> "DohCore":
+    """Get the shared DohCore, creating it on first use"""
+    global _doh
+    if _doh is None:
+        from .core import DohCore
+
+        _doh = DohCore()
+    return _doh
 
 
 @click.group(invoke_without_command=True)
@@ -68,6 +67,8 @@ def main(ctx, force, threshold, name):
     When run without a command, adds current directory to monitoring
     (or shows status if already monitored).
     """
+    doh = get_doh()
+
     # First-run setup
     doh.config.setup_first_run()
 
@@ -77,10 +78,15 @@ def main(ctx, force, threshold, name):
 
     # If no subcommand was invoked, act like 'add' for current directory
     if ctx.invoked_subcommand is None:
+        from .git_operations import force_commit_directory
+        from .git_stats import GitStats
+        from .status_display import show_single_directory_status
+
         directory = Path.cwd().resolve()
+        dir_info = doh.get_monitored(directory)
 
         # Smart behavior: if already monitored, check if auto-commit is needed
-        if doh.is_monitored(directory):
+        if dir_info is not None:
             msg = (
                 f"{Colors.YELLOW}Directory already monitored. "
                 f"Checking status:{Colors.RESET}"
@@ -89,9 +95,6 @@ def main(ctx, force, threshold, name):
             click.echo()
 
             # Get current stats and threshold for this directory
-            data = doh.config.load()
-            directories = data.get("directories", {})
-            dir_info = directories.get(str(directory), {})
             dir_threshold = dir_info.get("threshold", DEFAULT_THRESHOLD)
 
             stats = GitStats.get_stats(directory)
@@ -106,22 +109,24 @@ def main(ctx, force, threshold, name):
                         f"({total_changes}/{dir_threshold}). "
                         f"Auto-committing...{Colors.RESET}"
                     )
-                    click.echo(threshold_msg)
-                    if force_commit_directory(directory, doh):
-                        success_msg = (
+                    out = [threshold_msg]
+                    if force_commit_directory(directory, doh, stats):
+                        out.append(
                             f"{Colors.GREEN}✓ Changes committed "
                             f"successfully{Colors.RESET}"
                         )
-                        click.echo(success_msg)
                     else:
-                        fail_msg = (
+                        out.append(
                             f"{Colors.YELLOW}⚠ Auto-commit failed or "
                             f"no changes to commit{Colors.RESET}"
                         )
-                        click.echo(fail_msg)
-                    click.echo()
+                    out.append("")
+                    click.echo("\n".join(out))
 
-            show_single_directory_status(directory, doh)
+                    # Committing changed the tree; let the status re-read it
+                    stats = None
+
+            show_single_directory_status(directory, doh, stats)
             return
 
         # Handle force commit first if requested (for new directories)
@@ -138,13 +143,14 @@ def main(ctx, force, threshold, name):
 
         if doh.add_directory(directory, threshold, name):
             display_name = name or directory.name
-            click.echo(
+            out = [
                 f"{Colors.GREEN}✓ Added '{display_name}' to monitoring"
-                f"{Colors.RESET}"
-            )
-            click.echo(f"  Path: {directory}")
-            click.echo(f"  Threshold: {threshold} lines")
-            click.echo()
+                f"{Colors.RESET}",
+                f"  Path: {directory}",
+                f"  Threshold: {threshold} lines",
+                "",
+            ]
+            click.echo("\n".join(out))
             show_single_directory_status(directory, doh)
         else:
             click.echo(
@@ -172,7 +178,9 @@ def main(ctx, force, threshold, name):
 @click.pass_context
 def add(ctx, directory, threshold, name):
     """Add a directory to monitoring"""
-    handle_add_command(ctx, directory, threshold, name, doh)
+    from .command_handlers import handle_add_command
+
+    handle_add_command(ctx, directory, threshold, name, get_doh())
 
 
 @main.command("rm")
@@ -183,13 +191,17 @@ def add(ctx, directory, threshold, name):
 )
 def remove(directory):
     """Remove a directory from monitoring and exclusions"""
-    handle_remove_command(directory, doh)
+    from .command_handlers import handle_remove_command
+
+    handle_remove_command(directory, get_doh())
 
 
 @main.command()
 def list():
     """List all monitored directories"""
-    handle_list_command(doh)
+    from .command_handlers import handle_list_command
+
+    handle_list_command(get_doh())
 
 
 @main.command()
@@ -206,7 +218,9 @@ def list():
 )
 def status(show_global, directory):
     """Show status of current directory (default) or all monitored directories (--global)"""
-    handle_status_command(show_global, directory, doh)
+    from .command_handlers import handle_status_command
+
+    handle_status_command(show_global, directory, get_doh())
 
 
 @main.group("ex")
@@ -223,7 +237,9 @@ def exclusions():
 )
 def exclusions_add(directory):
     """Add a directory to exclusions"""
-    handle_exclusions_add_command(directory, doh)
+    from .command_handlers import handle_exclusions_add_command
+
+    handle_exclusions_add_command(directory, get_doh())
 
 
 @exclusions.command("rm")
@@ -234,13 +250,17 @@ def exclusions_add(directory):
 )
 def exclusions_remove(directory):
     """Remove a directory from exclusions"""
-    handle_exclusions_remove_command(directory, doh)
+    from .command_handlers import handle_exclusions_remove_command
+
+    handle_exclusions_remove_command(directory, get_doh())
 
 
 @exclusions.command("list")
 def exclusions_list():
     """List all excluded directories"""
-    handle_exclusions_list_command(doh)
+    from .command_handlers import handle_exclusions_list_command
+
+    handle_exclusions_list_command(get_doh())
 
 
 # Add aliases for common commands
@@ -294,6 +314,8 @@ def config(
     temp_branch_cleanup_days,
 ):
     """Show configuration or modify settings with --set"""
+    from .command_handlers import handle_config_command
+
     handle_config_command(
         set,
         git_profile,
@@ -302,7 +324,7 @@ def config(
         temp_branches,
         temp_branch_prefix,
         temp_branch_cleanup_days,
-        doh,
+        get_doh(),
     )
 
 
@@ -318,7 +340,9 @@ def run(verbose):
         doh run           # Check all directories once
         doh run -v        # Check with verbose output
     """
-    handle_run_command(verbose, doh)
+    from .command_handlers import handle_run_command
+
+    handle_run_command(verbose, get_doh())
 
 
 @main.command("squash", short_help="Squash auto-commits")
@@ -336,6 +360,8 @@ def run(verbose):
 )
 def squash(commit_message, target, directory):
     """Squash temporary auto-commits into a single commit with proper message"""
+    from .command_handlers import handle_squash_command
+
     handle_squash_command(commit_message, target, directory)
 
 
@@ -377,6 +403,8 @@ def s(ctx, commit_message, target, directory):
 )
 def cleanup(cleanup_days, force, directory):
     """Clean up old temporary branches"""
+    from .command_handlers import handle_cleanup_command
+
     handle_cleanup_command(cleanup_days, force, directory)
 
 
@@ -2,23 +2,45 @@
 Color constants for terminal output
 """
 
-try:
-    from colorama import init, Fore, Style
+import os
+import sys
 
-    init(autoreset=True)
+
+def _color_enabled() -> bool:
+    """Use colors only on a terminal, and never when NO_COLOR is set"""
+    if os.environ.get("NO_COLOR"):
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+_enabled = _color_enabled()
+
+if _enabled and os.name == "nt":
+    # Only the Windows console needs colorama to translate ANSI sequences
+    try:
+        from colorama import init
+
+        init(autoreset=True)
+    except ImportError:
+        _enabled = False
+
+if _enabled:
 
     class Colors:
         """Color constants for terminal output"""
 
-        RED = Fore.RED
-        GREEN = Fore.GREEN
-        YELLOW = Fore.YELLOW
-        BLUE = Fore.BLUE
-        BOLD = Style.BRIGHT
-        RESET = Style.RESET_ALL
+        RED = "\033[31m"
+        GREEN = "\033[32m"
+        YELLOW = "\033[33m"
+        BLUE = "\033[34m"
+        BOLD = "\033[1m"
+        RESET = "\033[0m"
 
-except ImportError:
-    # Fallback for environments without colorama
+else:
+    # Fallback for pipes, NO_COLOR and Windows without colorama
     class Colors:
         RED = ""
         GREEN = ""
@@ -6,14 +6,19 @@ This module contains the Click command handler functions
 that implement the main CLI commands.
 """
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Any, Optional
 import click
 from .colors import Colors
 from .config import DEFAULT_THRESHOLD
-from .git_stats import GitStats
+from .git_stats import GitStats, map_directories
+from .paths import existing_paths
 from .status_display import (
+    CLEAN_LABEL,
+    NOT_A_REPO_LABEL,
+    NOT_FOUND_LABEL,
     show_single_directory_status,
     show_global_status,
     show_local_status
@@ -108,7 +113,7 @@ def handle_remove_command(directory: Optional[Path], doh_core: Any) -> None:
 
 def handle_list_command(doh_core: Any) -> None:
     """Handle the list command logic"""
-    data = doh_core.config.load()
+    data = doh_core.config.load_readonly()
     directories = data.get("directories", {})
 
     if not directories:
@@ -117,27 +122,36 @@ def handle_list_command(doh_core: Any) -> None:
         )
         return
 
-    click.echo(f"{Colors.BOLD}Monitored Directories:{Colors.RESET}")
-    click.echo("-" * 80)
+    existing = existing_paths(directories)
 
-    for dir_path, info in directories.items():
-        directory = Path(dir_path)
-        name = info.get("name", directory.name)
+    def stats_for(dir_path: str) -> Optional[dict]:
+        # No point asking git about a missing directory
+        if dir_path not in existing:
+            return None
+        return GitStats.get_stats(Path(dir_path))
+
+    all_stats = map_directories(stats_for, directories)
+
+    # click.echo() flushes on every call, so collect the listing and
+    # write it once
+    out = [f"{Colors.BOLD}Monitored Directories:{Colors.RESET}", "-" * 80]
+
+    for (dir_path, info), stats in zip(directories.items(), all_stats):
+        name = info.get("name") or os.path.basename(dir_path)
         threshold = info.get("threshold", DEFAULT_THRESHOLD)
 
-        # Get git stats
-        stats = GitStats.get_stats(directory)
+        found = dir_path in existing
 
-        if stats is None:
-            status = f"{Colors.RED}NOT A GIT REPO{Colors.RESET}"
-        elif not directory.exists():
-            status = f"{Colors.RED}DIRECTORY NOT FOUND{Colors.RESET}"
+        if not found:
+            status = NOT_FOUND_LABEL
+        elif stats is None:
+            status = NOT_A_REPO_LABEL
         else:
             total_changes = stats["total_changes"]
             untracked_lines = stats.get("untracked_lines", stats["untracked"])
 
             if total_changes + untracked_lines == 0:
-                status = f"{Colors.GREEN}CLEAN{Colors.RESET}"
+                status = CLEAN_LABEL
             elif total_changes + untracked_lines >= threshold:
                 total_all = total_changes + untracked_lines
                 status = (
@@ -148,20 +162,21 @@ def handle_list_command(doh_core: Any) -> None:
                 total_all = total_changes + untracked_lines
                 status = f"{Colors.YELLOW}CHANGES ({total_all}){Colors.RESET}"
 
-        click.echo(f"{Colors.BLUE}{name:<30}{Colors.RESET} {status}")
-        click.echo(f"  Path: {dir_path}")
-        click.echo(f"  Threshold: {threshold}")
+        out.append(f"{Colors.BLUE}{name:<30}{Colors.RESET} {status}")
+        out.append(f"  Path: {dir_path}")
+        out.append(f"  Threshold: {threshold}")
 
         if stats:
-            changes_info = (
+            out.append(
                 f"  Changes: +{stats['added']} -{stats['deleted']} "
                 f"(files: {stats['files_changed']})"
             )
-            click.echo(changes_info)
             if stats["untracked"] > 0:
-                click.echo(f"  Untracked: {stats['untracked']} files")
+                out.append(f"  Untracked: {stats['untracked']} files")
 
-        click.echo()
+        out.append("")
+
+    click.echo("\n".join(out))
 
 
 def handle_status_command(
@@ -219,29 +234,30 @@ def handle_exclusions_remove_command(
 
 def handle_exclusions_list_command(doh_core: Any) -> None:
     """Handle the exclusions list command logic"""
-    data = doh_core.config.load()
+    data = doh_core.config.load_readonly()
     exclusions_dict = data.get("exclusions", {})
 
     if not exclusions_dict:
         click.echo(f"{Colors.YELLOW}No directories excluded{Colors.RESET}")
         return
 
-    click.echo(f"{Colors.BOLD}Excluded Directories:{Colors.RESET}")
-    click.echo("-" * 80)
+    out = [f"{Colors.BOLD}Excluded Directories:{Colors.RESET}", "-" * 80]
+
+    existing = existing_paths(exclusions_dict)
+    exists_label = f"{Colors.GREEN}EXISTS{Colors.RESET}"
+    missing_label = f"{Colors.RED}NOT FOUND{Colors.RESET}"
 
     for dir_path, info in exclusions_dict.items():
-        directory = Path(dir_path)
         excluded_date = info.get("excluded", "Unknown")
+        status = exists_label if dir_path in existing else missing_label
 
-        if directory.exists():
-            status = f"{Colors.GREEN}EXISTS{Colors.RESET}"
-        else:
-            status = f"{Colors.RED}NOT FOUND{Colors.RESET}"
+        dir_name = os.path.basename(dir_path)
+        out.append(f"{Colors.BLUE}{dir_name:<30}{Colors.RESET} {status}")
+        out.append(f"  Path: {dir_path}")
+        out.append(f"  Excluded: {excluded_date}")
+        out.append("")
 
-        click.echo(f"{Colors.BLUE}{directory.name:<30}{Colors.RESET} {status}")
-        click.echo(f"  Path: {dir_path}")
-        click.echo(f"  Excluded: {excluded_date}")
-        click.echo()
+    click.echo("\n".join(out))
 
 
 def handle_config_command(
@@ -256,14 +272,14 @@ def handle_config_command(
 ) -> None:
     """Handle the config command logic"""
     # Check if any configuration options are provided
-    has_config_options = any([
-        git_profile,
-        threshold,
-        auto_init_git is not None,
-        temp_branches is not None,
-        temp_branch_prefix,
-        temp_branch_cleanup_days,
-    ])
+    has_config_options = bool(
+        git_profile
+        or threshold
+        or auto_init_git is not None
+        or temp_branches is not None
+        or temp_branch_prefix
+        or temp_branch_cleanup_days
+    )
 
     if has_config_options and not set_config:
         click.echo(
@@ -310,7 +326,7 @@ def handle_config_command(
 
 def handle_run_command(verbose: bool, doh_core: Any) -> None:
     """Handle the run command logic"""
-    data = doh_core.config.load()
+    data = doh_core.config.load_readonly()
     directories = data.get("directories", {})
 
     if not directories:
@@ -359,8 +375,8 @@ def handle_squash_command(
         )
         return
 
-    # Check if there are temp branches to squash
-    temp_branches = GitStats.list_temp_branches(directory)
+    # Check if there are temp branches to squash; only names are needed
+    temp_branches = GitStats.list_temp_branch_names(directory)
     if not temp_branches:
         click.echo(
             f"{Colors.YELLOW}No temporary branches found to squash"
@@ -372,7 +388,8 @@ def handle_squash_command(
     try:
         current_branch = subprocess.run(
             ["git", "-C", str(directory), "branch", "--show-current"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
         ).stdout.strip()
@@ -381,9 +398,8 @@ def handle_squash_command(
         if current_branch.startswith("doh-auto-commits"):
             temp_branch = current_branch
         elif temp_branches:
-            # Use most recent temp branch
-            sorted_branches = sorted(temp_branches, key=lambda b: b["name"])
-            temp_branch = sorted_branches[-1]["name"]
+            # Use most recent temp branch (names end in a timestamp)
+            temp_branch = max(temp_branches)
 
         if not temp_branch:
             click.echo(
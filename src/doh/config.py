@@ -2,11 +2,15 @@
 Configuration management for DOH
 """
 
+import copy
 import json
+import mmap
+import os
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict
+from typing import Dict, FrozenSet
 
 from .colors import Colors
 
@@ -20,62 +24,147 @@ except ImportError:
 
     click = MockClick()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Set to False to force the stdlib json module even if a faster one is installed
+USE_FAST_JSON = True
+
 # Constants
 DEFAULT_THRESHOLD = 50
+DEFAULT_GLOBAL_SETTINGS = {
+    "default_threshold": DEFAULT_THRESHOLD,
+    "git_profile": "",
+    "auto_init_git": True,
+    "git_init_command": "git init",
+    "use_temp_branches": True,
+    "temp_branch_prefix": "doh-auto-commits",
+    "auto_cleanup_temp_branches": True,
+    "max_temp_branch_age_days": 365,
+}
+# Shared template - hand out copies via DohConfig._get_default_config()
+_DEFAULT_CONFIG = {
+    "global_settings": DEFAULT_GLOBAL_SETTINGS,
+    "directories": {},
+    "exclusions": {},
+}
+# Configs at least this large are memory-mapped instead of read into a buffer
+MMAP_MIN_SIZE = 64 * 1024
 DOH_CONFIG_DIR = Path.home() / ".doh"
 DOH_CONFIG_FILE = DOH_CONFIG_DIR / "config.json"
 
 
+def _json_loads(raw: bytes) -> Dict:
+    """Parse config bytes with the fastest available JSON library"""
+    if USE_FAST_JSON and orjson is not None:
+        return orjson.loads(raw)
+    if USE_FAST_JSON and ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Dict) -> bytes:
+    """Serialize config to indented JSON bytes"""
+    if USE_FAST_JSON and orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    if USE_FAST_JSON and ujson is not None:
+        # ujson escapes "/" by default, which would mangle every path
+        return (
+            ujson.dumps(data, indent=2, escape_forward_slashes=False) + "\n"
+        ).encode("utf-8")
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _read_json(f, size: int) -> Dict:
+    """Parse an open config file, mapping it rather than copying when large"""
+    # Only orjson parses straight from a buffer; for small files the mmap
+    # setup costs more than the copy it saves
+    if size >= MMAP_MIN_SIZE and USE_FAST_JSON and orjson is not None:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    return _json_loads(f.read())
+
+
+def _normalize(data: Dict) -> Dict:
+    """Ensure all required sections exist, filling in default settings"""
+    data.setdefault("directories", {})
+    exclusions = data.setdefault("exclusions", {})
+    if isinstance(exclusions, list):
+        # Older versions stored exclusions as a plain list of paths
+        data["exclusions"] = {path: {} for path in exclusions}
+    data["global_settings"] = {
+        **DEFAULT_GLOBAL_SETTINGS,
+        **data.get("global_settings", {}),
+    }
+    return data
+
+
 class DohConfig:
     """Handles all configuration management"""
 
+    # Config files already backed up by this process
+    _backed_up = set()
+
     def __init__(self):
         self.config_file = DOH_CONFIG_FILE
         self.config_dir = DOH_CONFIG_DIR
+        # Parsed config, keyed on (path, mtime_ns, size) of the file it came from
+        self._cache = None
+        self._cache_key = None
+        self._exclusions_set = None
         self._ensure_config_dir()
 
     def _ensure_config_dir(self):
         """Ensure config directory exists"""
-        self.config_dir.mkdir(exist_ok=True)
-        (self.config_dir / "logs").mkdir(exist_ok=True)
+        # One mkdir when the tree already exists; parents=True creates
+        # config_dir itself only on first run
+        (self.config_dir / "logs").mkdir(parents=True, exist_ok=True)
 
     def _get_default_config(self) -> Dict:
         """Get default configuration structure"""
-        return {
-            "global_settings": {
-                "default_threshold": DEFAULT_THRESHOLD,
-                "git_profile": "",
-                "auto_init_git": True,
-                "git_init_command": "git init",
-                "use_temp_branches": True,
-                "temp_branch_prefix": "doh-auto-commits",
-                "auto_cleanup_temp_branches": True,
-                "max_temp_branch_age_days": 365,
-            },
-            "directories": {},
-            "exclusions": [],
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+    def _stat_key(self):
+        """Return the cache key for the config file, or None if it is missing"""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return (str(self.config_file), st.st_mtime_ns, st.st_size)
 
     def load(self) -> Dict:
         """Load configuration, creating default if needed"""
-        if not self.config_file.exists():
-            return self._get_default_config()
+        return copy.deepcopy(self.load_readonly())
 
-        try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
+    def load_readonly(self) -> Dict:
+        """Load configuration without copying it.
 
-            # Ensure all required sections exist
-            default = self._get_default_config()
-            for section in ["directories", "exclusions", "global_settings"]:
-                if section not in data:
-                    data[section] = default[section]
+        The returned dict is shared with the in-process cache and must not be
+        mutated; use load() when the data is going to be changed and saved.
+        """
+        key = self._stat_key()
+        if key is None:
+            return self._get_default_config()
+        if key == self._cache_key:
+            return self._cache
 
-            # Merge global_settings with defaults
-            for key, value in default["global_settings"].items():
-                if key not in data["global_settings"]:
-                    data["global_settings"][key] = value
+        try:
+            with open(self.config_file, "rb") as f:
+                data = _read_json(f, key[2])
 
+            self._cache = _normalize(data)
+            self._cache_key = key
+            self._exclusions_set = None
             return data
         except Exception as e:
             try:
@@ -86,16 +175,51 @@ class DohConfig:
                 print(f"WARNING: Could not read config ({e}), using defaults")
             return self._get_default_config()
 
+    def load_exclusions(self) -> FrozenSet[str]:
+        """Return excluded paths as a frozenset, built once per config parse"""
+        data = self.load_readonly()
+        if data is not self._cache:
+            # Defaults for a missing/unreadable file are never cached
+            return frozenset(data.get("exclusions", ()))
+        if self._exclusions_set is None:
+            self._exclusions_set = frozenset(data.get("exclusions", ()))
+        return self._exclusions_set
+
     def save(self, data: Dict) -> bool:
         """Save configuration to file"""
+        self._cache = self._cache_key = None
+        tmp_file = None
         try:
-            # Backup existing config
-            self._backup_config()
-
-            with open(self.config_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Write next to the config and rename over it, so a crash
+            # mid-write can never leave a truncated config behind; a unique
+            # name keeps concurrent doh processes off each other's file
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.config_file.parent, prefix=".config.", suffix=".tmp"
+            )
+            tmp_file = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(data))
+                # Make sure the data is on disk before the rename publishes it
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Backup existing config (once per process is enough)
+            if str(self.config_file) not in DohConfig._backed_up:
+                self._backup_config()
+
+            os.replace(tmp_file, self.config_file)
+
+            # Cache what load_readonly() would parse back from the file
+            self._cache = _normalize(copy.deepcopy(data))
+            self._cache_key = self._stat_key()
+            self._exclusions_set = None
             return True
         except Exception as e:
+            if tmp_file is not None:
+                try:
+                    tmp_file.unlink()
+                except OSError:
+                    pass
             try:
                 click.echo(
                     f"{Colors.RED}ERROR: Could not save config: {e}{Colors.RESET}"
@@ -106,26 +230,45 @@ class DohConfig:
 
     def _backup_config(self):
         """Create backup of current config (keep last 2)"""
-        if self.config_file.exists():
-            backup1 = self.config_file.with_suffix(".json.backup.1")
-            backup2 = self.config_file.with_suffix(".json.backup.2")
+        backup1 = self.config_file.with_suffix(".json.backup.1")
+        backup2 = self.config_file.with_suffix(".json.backup.2")
 
-            # Rotate backups
-            if backup1.exists():
-                backup1.replace(backup2)
-            self.config_file.replace(backup1)
+        # Rotate backups; missing files just mean there is nothing to move.
+        # The current config is copied, not moved, so it stays in place
+        # until the new one is renamed over it
+        try:
+            backup1.replace(backup2)
+        except FileNotFoundError:
+            pass
+        try:
+            shutil.copy2(self.config_file, backup1)
+        except FileNotFoundError:
+            return
+        DohConfig._backed_up.add(str(self.config_file))
 
     def setup_first_run(self):
         """Setup DOH for first run - create config and systemd daemon"""
+        # The config records that the daemon setup has run (whether or not
+        # systemd was there to take it), so later invocations skip the
+        # mkdir and systemctl work. Older configs get it set up once
+        config_exists = os.path.exists(self.config_file)
+        current = self.load_readonly()
+        if config_exists and current.get("systemd_setup_attempted"):
+            return True
+
         try:
-            # Ensure config directory and basic config
+            # Ensure config directory exists
             self._ensure_config_dir()
-            if not self.config_file.exists():
-                self.save(self._get_default_config())
 
             # Setup systemd daemon if available
             self._setup_systemd_daemon()
 
+            # Never overwrite a config that exists but could not be read
+            if not config_exists or current is self._cache:
+                data = copy.deepcopy(current)
+                data["systemd_setup_attempted"] = True
+                self.save(data)
+
             return True
         except Exception as e:
             try:
@@ -198,17 +341,20 @@ WantedBy=timers.target
             subprocess.run(
                 ["systemctl", "--user", "daemon-reload"],
                 check=False,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             subprocess.run(
                 ["systemctl", "--user", "enable", "doh-monitor.timer"],
                 check=False,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             subprocess.run(
                 ["systemctl", "--user", "start", "doh-monitor.timer"],
                 check=False,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             return True
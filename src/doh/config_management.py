@@ -102,7 +102,7 @@ def show_config_display(doh_core: Any) -> None:
     click.echo(f"Config dir: {doh_core.config.config_dir}")
     click.echo()
 
-    data = doh_core.config.load()
+    data = doh_core.config.load_readonly()
 
     directories = data.get("directories", {})
     exclusions_dict = data.get("exclusions", {})
@@ -120,6 +120,8 @@ def show_config_display(doh_core: Any) -> None:
     temp_cleanup_days = settings.get('max_temp_branch_age_days', 365)
     click.echo(f"Temp branch cleanup days: {temp_cleanup_days}")
 
-    if doh_core.config.config_file.exists():
+    try:
         size = doh_core.config.config_file.stat().st_size
-        click.echo(f"Config file size: {size} bytes")
+    except FileNotFoundError:
+        return
+    click.echo(f"Config file size: {size} bytes")
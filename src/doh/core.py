@@ -2,10 +2,11 @@
 Core DOH functionality
 """
 
+import os
 import subprocess
-from datetime import datetime, timezone
+import time
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from .config import DohConfig
 from .git_stats import GitStats
@@ -22,6 +23,26 @@ except ImportError:
     click = MockClick()
 
 
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, e.g. 2024-01-31T12:00:00Z"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _find_excluded(path: str, exclusions: FrozenSet[str]) -> Optional[str]:
+    """Return path or its nearest ancestor that is in exclusions
+
+    Walks the string with os.path.dirname instead of Path.parents, which
+    builds a new Path object per level.
+    """
+    while True:
+        if path in exclusions:
+            return path
+        parent = os.path.dirname(path) or "."
+        if parent == path:
+            return None
+        path = parent
+
+
 class DohCore:
     """Core DOH functionality"""
 
@@ -30,40 +51,33 @@ class DohCore:
 
     def is_excluded(self, directory: Path) -> bool:
         """Check if directory or any parent is excluded"""
-        data = self.config.load()
-        exclusions = data.get("exclusions", {})
-
-        # Check directory itself
-        if str(directory) in exclusions:
-            return True
-
-        # Check parents
-        for parent in directory.parents:
-            if str(parent) in exclusions:
-                return True
-
-        return False
+        exclusions = self.config.load_exclusions()
+        if not exclusions:
+            return False
+        return _find_excluded(str(directory), exclusions) is not None
 
     def find_excluded_parent(self, directory: Path) -> Optional[Path]:
         """Find which excluded parent is blocking this directory"""
-        data = self.config.load()
-        exclusions = data.get("exclusions", {})
+        exclusions = self.config.load_exclusions()
+        if not exclusions:
+            return None
 
-        # Check directory itself
-        if str(directory) in exclusions:
-            return directory
+        excluded = _find_excluded(str(directory), exclusions)
+        if excluded is None:
+            return None
+        return directory if excluded == str(directory) else Path(excluded)
 
-        # Check parents
-        for parent in directory.parents:
-            if str(parent) in exclusions:
-                return parent
+    def get_monitored(self, directory: Path) -> Optional[dict]:
+        """Get a monitored directory's config entry, or None if not monitored
 
-        return None
+        The entry is shared with the config cache and must not be mutated.
+        """
+        data = self.config.load_readonly()
+        return data.get("directories", {}).get(str(directory))
 
     def is_monitored(self, directory: Path) -> bool:
         """Check if directory is being monitored"""
-        data = self.config.load()
-        return str(directory) in data.get("directories", {})
+        return self.get_monitored(directory) is not None
 
     def _handle_exclusion_error(self, directory: Path, excluded_parent: Path) -> None:
         """Handle exclusion error messages"""
@@ -106,8 +120,8 @@ class DohCore:
             subprocess.run(
                 ["git", "init"],
                 cwd=directory,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             try:
@@ -149,7 +163,7 @@ class DohCore:
 
     def _initialize_git_repository(self, directory: Path) -> bool:
         """Initialize git repository if auto_init is enabled"""
-        data = self.config.load()
+        data = self.config.load_readonly()
         auto_init = data.get("global_settings", {}).get("auto_init_git", True)
 
         if auto_init:
@@ -163,7 +177,7 @@ class DohCore:
     ) -> bool:
         """Add directory to configuration"""
         data = self.config.load()
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = _now_iso()
 
         if not name:
             name = directory.name
@@ -179,8 +193,8 @@ class DohCore:
 
     def add_directory(self, directory: Path, threshold: int, name: str) -> bool:
         """Add directory to monitoring"""
-        if self.is_excluded(directory):
-            excluded_parent = self.find_excluded_parent(directory)
+        excluded_parent = self.find_excluded_parent(directory)
+        if excluded_parent is not None:
             self._handle_exclusion_error(directory, excluded_parent)
             return False
 
@@ -211,13 +225,13 @@ class DohCore:
 
     def add_exclusion(self, directory: Path) -> bool:
         """Add directory to exclusions"""
-        # Remove from monitoring if it exists
-        self.remove_directory(directory)
-
         data = self.config.load()
-        timestamp = datetime.now(timezone.utc).isoformat()
+        dir_str = str(directory)
+        timestamp = _now_iso()
 
-        data["exclusions"][str(directory)] = {"excluded": timestamp}
+        # Stop monitoring it in the same write
+        data["directories"].pop(dir_str, None)
+        data["exclusions"][dir_str] = {"excluded": timestamp}
 
         return self.config.save(data)
 
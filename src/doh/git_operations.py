@@ -6,50 +6,56 @@ This module contains functions for performing git operations
 like force commits, auto-commits, and branch management.
 """
 
+import os
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Tuple
 import click
 from .colors import Colors
-from .git_stats import GitStats
+from .git_stats import GitStats, map_directories
+from .paths import existing_paths
 
 
-def force_commit_directory(directory: Path, doh_core: Any) -> bool:
-    """Force commit all changes in a directory"""
-    if not GitStats.is_git_repo(directory):
-        return False
+@lru_cache(maxsize=None)
+def git_profile_args(git_profile: str) -> Tuple[str, ...]:
+    """Get the git options that apply a configured profile, if it exists
+
+    Cached, so `doh run` expands and checks the profile path once rather
+    than once per repository.
+    """
+    if not git_profile:
+        return ()
+    profile_path = Path(git_profile).expanduser()
+    if not profile_path.exists():
+        return ()
+    return ("-c", f"include.path={profile_path}")
+
 
+def force_commit_directory(
+    directory: Path, doh_core: Any, stats: Optional[dict] = None
+) -> bool:
+    """Force commit all changes in a directory, staging from stats if given"""
     try:
-        # Get current stats for enhanced commit message
-        stats = GitStats.get_stats(directory)
+        # Get current stats for enhanced commit message; None for non-repos
+        if stats is None:
+            stats = GitStats.get_stats(directory)
         if not stats:
             return False
 
+        if stats.get("paths") == []:
+            # Nothing changed, so staging and committing would both be no-ops
+            return False
+
         # Get git profile from config if set
-        data = doh_core.config.load()
+        data = doh_core.config.load_readonly()
         git_profile = data.get("global_settings", {}).get("git_profile", "")
 
-        git_cmd = ["git", "-C", str(directory)]
-
-        # Add git profile config if specified
-        if git_profile:
-            profile_path = Path(git_profile).expanduser()
-            if profile_path.exists():
-                git_cmd.extend(["-c", f"include.path={profile_path}"])
+        git_cmd = ["git", "-C", str(directory), *git_profile_args(git_profile)]
 
         # Add all changes
-        subprocess.run(git_cmd + ["add", "."], check=True, capture_output=True)
-
-        # Check if there's anything to commit
-        result = subprocess.run(
-            git_cmd + ["diff", "--staged", "--quiet"],
-            capture_output=True,
-            check=False
-        )
-
-        if result.returncode == 0:
-            # Nothing staged to commit
-            return False
+        stage_changes(git_cmd, stats)
 
         # Create enhanced commit message for force commit
         file_changes = GitStats.format_file_changes(
@@ -57,10 +63,14 @@ def force_commit_directory(directory: Path, doh_core: Any) -> bool:
         )
         commit_msg = f"Manual commit: {file_changes}"
 
+        # With nothing staged, commit itself exits non-zero, so there is
+        # no need for a separate `git diff --staged --quiet` check first.
+        # --quiet also skips the diffstat summary nobody reads
         subprocess.run(
-            git_cmd + ["commit", "-m", commit_msg],
+            git_cmd + ["commit", "--quiet", "-m", commit_msg],
             check=True,
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         return True
 
@@ -75,26 +85,34 @@ def handle_temp_branch_strategy(
     use_temp_branches: bool,
     temp_branch_prefix: str,
     verbose: bool,
-) -> bool:
-    """Handle temporary branch creation and switching"""
+    current_branch: Optional[str] = None,
+) -> Optional[str]:
+    """Handle temporary branch creation and switching
+
+    Returns the temp branch to commit to, or None for direct commits.
+    Pass current_branch when get_stats() already reported it.
+    """
     if use_temp_branches:
         try:
+            if current_branch is None:
+                current_branch = subprocess.run(
+                    git_cmd + ["branch", "--show-current"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    check=True,
+                ).stdout.strip()
+
             # Get or create temp branch
             temp_branch = GitStats.get_or_create_temp_branch(
-                directory, temp_branch_prefix
+                directory, temp_branch_prefix, current_branch
             )
 
-            # Switch to temp branch if not already on it
-            current_branch = subprocess.run(
-                git_cmd + ["branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            ).stdout.strip()
-
+            # Switch to temp branch if not already on it (checking out a
+            # branch that was just created is a harmless no-op)
             if current_branch != temp_branch:
                 GitStats.switch_to_temp_branch(directory, temp_branch)
-            return True
+            return temp_branch
 
         except subprocess.CalledProcessError:
             # Fallback to direct commits if temp branch fails
@@ -103,31 +121,56 @@ def handle_temp_branch_strategy(
                     f"{Colors.YELLOW}⚠ Failed to create temp branch for "
                     f"{name}, using direct commits{Colors.RESET}"
                 )
-            return False
-    return use_temp_branches
+    return None
 
 
-def stage_and_check_changes(git_cmd: list, name: str, verbose: bool) -> bool:
-    """Stage changes and check if there's anything to commit"""
-    # Stage all changes
-    subprocess.run(git_cmd + ["add", "."], capture_output=True, check=True)
+def stage_changes(git_cmd: list, stats: dict) -> None:
+    """Stage the paths get_stats() reported instead of rescanning the tree"""
+    paths = stats.get("paths")
+    if paths is None:
+        subprocess.run(
+            git_cmd + ["add", "."],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return
+    if not paths:
+        return
+
+    # Untracked nested repositories are reported as "dir/"; update-index
+    # silently skips those, so they go through `git add` like before
+    directories = [path for path in paths if path.endswith("/")]
+    files = [path for path in paths if not path.endswith("/")]
+
+    if files:
+        # update-index takes literal paths and, unlike `git add <path>`, does
+        # not fail on deletions that are already staged
+        subprocess.run(
+            git_cmd + ["update-index", "--add", "--remove", "-z", "--stdin"],
+            input=b"\0".join(os.fsencode(path) for path in files),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    if directories:
+        subprocess.run(
+            git_cmd + ["--literal-pathspecs", "add", "--", *directories],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+
 
-    # Check if there's anything to commit
+def has_staged_changes(git_cmd: list) -> bool:
+    """Check if the index differs from HEAD"""
     result = subprocess.run(
         git_cmd + ["diff", "--staged", "--quiet"],
-        capture_output=True,
-        check=False
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
     )
-
-    if result.returncode == 0:
-        # Nothing staged to commit
-        if verbose:
-            click.echo(
-                f"{Colors.YELLOW}• {name}: No changes to commit"
-                f"{Colors.RESET}"
-            )
-        return False
-    return True
+    return result.returncode != 0
 
 
 def create_commit_and_log(
@@ -135,8 +178,7 @@ def create_commit_and_log(
     name: str,
     stats: dict,
     threshold: int,
-    use_temp_branches: bool,
-    temp_branch_prefix: str,
+    temp_branch: Optional[str],
 ) -> None:
     """Create commit and display success log"""
     # Use enhanced commit message format
@@ -144,9 +186,12 @@ def create_commit_and_log(
         name, stats, threshold
     )
 
-    # Commit changes
+    # Commit changes; --quiet skips computing the diffstat summary
     subprocess.run(
-        git_cmd + ["commit", "-m", commit_msg], capture_output=True, check=True
+        git_cmd + ["commit", "--quiet", "-m", commit_msg],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
     )
 
     # Create enhanced log message with file details
@@ -154,10 +199,7 @@ def create_commit_and_log(
         stats.get("file_stats", []), max_files=3
     )
 
-    if use_temp_branches:
-        temp_branch = GitStats.get_or_create_temp_branch(
-            Path(git_cmd[2]), temp_branch_prefix
-        )
+    if temp_branch:
         click.echo(
             f"{Colors.GREEN}✓ Auto-committed '{name}' to temp branch "
             f"'{temp_branch}': {file_summary}{Colors.RESET}"
@@ -175,50 +217,55 @@ def auto_commit_directory(
     threshold: int,
     name: str,
     verbose: bool,
-    doh_core: Any
+    doh_core: Any,
+    global_settings: Optional[dict] = None,
 ) -> bool:
-    """Perform auto-commit for a directory"""
+    """Perform auto-commit for a directory
+
+    Pass global_settings when committing several directories so the
+    config is read once for the whole run.
+    """
     try:
         # Get configuration settings
-        data = doh_core.config.load()
-        global_settings = data.get("global_settings", {})
+        if global_settings is None:
+            data = doh_core.config.load_readonly()
+            global_settings = data.get("global_settings", {})
         use_temp_branches = global_settings.get("use_temp_branches", True)
         temp_branch_prefix = global_settings.get(
             "temp_branch_prefix", "doh-auto-commits"
         )
         git_profile = global_settings.get("git_profile", "")
 
-        git_cmd = ["git", "-C", str(directory)]
-
-        # Add git profile config if specified
-        if git_profile:
-            profile_path = Path(git_profile).expanduser()
-            if profile_path.exists():
-                git_cmd.extend(["-c", f"include.path={profile_path}"])
+        git_cmd = ["git", "-C", str(directory), *git_profile_args(git_profile)]
 
         # Handle temporary branch strategy
-        use_temp_branches = handle_temp_branch_strategy(
+        temp_branch = handle_temp_branch_strategy(
             directory,
             name,
             git_cmd,
             use_temp_branches,
             temp_branch_prefix,
-            verbose
+            verbose,
+            stats.get("branch"),
         )
 
-        # Stage and check for changes
-        if not stage_and_check_changes(git_cmd, name, verbose):
-            return False
+        # Stage all changes
+        stage_changes(git_cmd, stats)
 
         # Create commit and log success
-        create_commit_and_log(
-            git_cmd,
-            name,
-            stats,
-            threshold,
-            use_temp_branches,
-            temp_branch_prefix
-        )
+        try:
+            create_commit_and_log(git_cmd, name, stats, threshold, temp_branch)
+        except subprocess.CalledProcessError:
+            # commit also fails when nothing is staged (stale stats, dirty
+            # submodules); only then look at the index to tell them apart
+            if has_staged_changes(git_cmd):
+                raise
+            if verbose:
+                click.echo(
+                    f"{Colors.YELLOW}• {name}: No changes to commit"
+                    f"{Colors.RESET}"
+                )
+            return False
 
         return True
 
@@ -231,34 +278,96 @@ def auto_commit_directory(
         return False
 
 
+def progress_reporter(total: int):
+    """Return a map_directories() callback that redraws a progress line"""
+    done = ok = 0
+
+    def report(stats: Optional[dict]) -> None:
+        nonlocal done, ok
+        done += 1
+        if stats is not None:
+            ok += 1
+        click.echo(f"\rChecking: {done}/{total} ✓:{ok} ✗:{done - ok}", nl=False)
+
+    return report
+
+
+def repo_root(directory: Path) -> Optional[str]:
+    """Get the real path of the worktree containing directory"""
+    toplevel = subprocess.run(
+        ["git", "-C", str(directory), "rev-parse", "--show-toplevel"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=False,
+    ).stdout.strip()
+    return os.path.realpath(toplevel) if toplevel else None
+
+
+def in_any_repo(dir_path: str, roots: set) -> bool:
+    """Check if dir_path lies inside one of the given repository roots"""
+    real = os.path.realpath(dir_path)
+    return any(real == r or real.startswith(r + os.sep) for r in roots)
+
+
 def process_monitored_directories(
     directories: dict, verbose: bool, doh_core: Any
 ) -> int:
     """Process all monitored directories and return commit count"""
     from .config import DEFAULT_THRESHOLD
-    
-    committed = 0
 
-    for dir_path, info in directories.items():
-        directory = Path(dir_path)
+    if not directories:
+        return 0
+
+    existing = existing_paths(directories)
+
+    def stats_for(dir_path: str) -> Optional[dict]:
+        if dir_path not in existing:
+            return None
+        return GitStats.get_stats(Path(dir_path))
+
+    # Query the repositories concurrently; commits and output stay
+    # sequential and in config order
+    show_progress = verbose and sys.stdout.isatty()
+    all_stats = map_directories(
+        stats_for,
+        directories,
+        progress_reporter(len(directories)) if show_progress else None,
+    )
+    if show_progress:
+        # Clear the progress line before the per-directory output
+        click.echo("\r\033[K", nl=False)
+
+    global_settings = doh_core.config.load_readonly().get("global_settings", {})
+    committed = 0
+    # Repositories a commit (or temp-branch checkout) has touched this run;
+    # stats prefetched for other directories in them are stale
+    touched_roots = set()
+    # Status lines are buffered and written in one echo; the buffer is
+    # flushed before each commit so its own output stays in order
+    pending = []
+
+    for (dir_path, info), stats in zip(directories.items(), all_stats):
         # Get threshold and name from directory info
         threshold = info.get("threshold", DEFAULT_THRESHOLD)
-        name = info.get("name", directory.name)
+        name = info.get("name") or os.path.basename(dir_path)
 
-        if not directory.exists():
+        if dir_path not in existing:
             if verbose:
-                click.echo(
+                pending.append(
                     f"{Colors.RED}✗ Directory not found: {name} "
-                    f"({directory}){Colors.RESET}"
+                    f"({dir_path}){Colors.RESET}"
                 )
             continue
 
-        stats = GitStats.get_stats(directory)
+        if touched_roots and in_any_repo(dir_path, touched_roots):
+            stats = GitStats.get_stats(Path(dir_path))
+
         if stats is None:
             if verbose:
-                click.echo(
+                pending.append(
                     f"{Colors.RED}✗ Not a git repository: {name} "
-                    f"({directory}){Colors.RESET}"
+                    f"({dir_path}){Colors.RESET}"
                 )
             continue
 
@@ -267,14 +376,29 @@ def process_monitored_directories(
         )
 
         if total_changes >= threshold:
+            if pending:
+                click.echo("\n".join(pending))
+                pending.clear()
+            root = repo_root(Path(dir_path))
+            if root:
+                touched_roots.add(root)
             if auto_commit_directory(
-                directory, stats, threshold, name, verbose, doh_core
+                Path(dir_path),
+                stats,
+                threshold,
+                name,
+                verbose,
+                doh_core,
+                global_settings,
             ):
                 committed += 1
         elif verbose:
-            click.echo(
+            pending.append(
                 f"{Colors.GREEN}• {name}: {total_changes} changes "
                 f"(under threshold {threshold}){Colors.RESET}"
             )
 
+    if pending:
+        click.echo("\n".join(pending))
+
     return committed
@@ -2,18 +2,64 @@
 Git repository statistics gathering
 """
 
+import os
+import re
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# One `git diff --numstat -z` record: added, deleted ("-" for binary files),
+# then the path; renames give an empty path followed by "old\0new"
+_NUMSTAT_RE = re.compile(rb"(\d+|-)\t(\d+|-)\t(?:\0([^\0]*)\0)?([^\0]*)\0")
+
+# Upper bound on repositories queried at once across monitored directories
+MAX_STATS_WORKERS = 8
+
+T = TypeVar("T")
+
+
+def map_directories(
+    func: Callable[[str], T],
+    dir_paths: Iterable[str],
+    on_result: Optional[Callable[[T], None]] = None,
+) -> List[T]:
+    """Call func on each directory path concurrently, keeping input order
+
+    Gathering stats is mostly waiting on git, so overlapping the
+    subprocesses of several repositories cuts wall time roughly by the
+    number of workers. on_result, if given, is called from the calling
+    thread with each result as soon as it is ready, e.g. for progress.
+    """
+    dir_paths = list(dir_paths)
+    if not dir_paths:
+        return []
+    workers = min(MAX_STATS_WORKERS, len(dir_paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if on_result is None:
+            return list(pool.map(func, dir_paths))
+
+        futures = {pool.submit(func, path): i for i, path in enumerate(dir_paths)}
+        results = [None] * len(dir_paths)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            on_result(results[futures[future]])
+        return results
 
 
 class GitStats:
     """Handles git repository statistics"""
 
     @staticmethod
-    @staticmethod
-    def _process_new_repository_stats(directory: Path, untracked_info: dict) -> dict:
+    def _process_new_repository_stats(
+        directory: Path, untracked_info: dict, staged_files: list
+    ) -> dict:
         """Process statistics for new repository without commits"""
         file_stats = []
 
@@ -24,12 +70,14 @@ class GitStats:
             )
 
         # Check for staged files (new files ready to commit)
-        staged_info = GitStats._get_staged_new_files_info(directory)
+        staged_info = GitStats._count_file_lines(directory, staged_files)
         for file_path, line_count in staged_info.get("file_details", []):
             file_stats.append(
                 {"file": file_path, "added": line_count, "deleted": 0, "status": "new"}
             )
 
+        paths = [f["file"] for f in file_stats]
+
         return {
             "total_changes": staged_info["line_count"],  # Staged files count as changes
             "added": staged_info["line_count"],
@@ -38,61 +86,85 @@ class GitStats:
             "untracked": untracked_info["file_count"],
             "untracked_lines": untracked_info["line_count"],
             "file_stats": file_stats,
+            "paths": paths,
         }
 
     @staticmethod
-    def _process_diff_stats(directory: Path, untracked_info: dict) -> dict:
+    def _get_numstat(directory: Path) -> bytes:
+        """Get raw `git diff --numstat -z HEAD` output for tracked file changes"""
+        # -z keeps paths unquoted, so non-ASCII names come through verbatim;
+        # --relative scopes the diff to directory like the untracked list.
+        # stderr is never read: with stdout as the only pipe, subprocess
+        # reads it directly instead of multiplexing two pipes
+        return subprocess.run(
+            [
+                "git",
+                "-C",
+                str(directory),
+                "diff",
+                "--numstat",
+                "-z",
+                "--relative",
+                "HEAD",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        ).stdout
+
+    @staticmethod
+    def _process_diff_stats(
+        directory: Path, untracked_info: dict, numstat: Optional[bytes] = None
+    ) -> dict:
         """Process diff statistics for existing repository"""
         # Get detailed stats for tracked file changes
-        result = subprocess.run(
-            ["git", "-C", str(directory), "diff", "--numstat", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        if numstat is None:
+            numstat = GitStats._get_numstat(directory)
 
         added = deleted = files_changed = 0
         file_stats = []
+        # Everything a commit needs to stage, including rename sources
+        paths = []
+
+        for raw_added, raw_deleted, raw_old_path, raw_path in _NUMSTAT_RE.findall(
+            numstat
+        ):
+            file_added = 0 if raw_added == b"-" else int(raw_added)
+            file_deleted = 0 if raw_deleted == b"-" else int(raw_deleted)
+
+            added += file_added
+            deleted += file_deleted
+            files_changed += 1
+
+            # Determine file status
+            if file_added > 0 and file_deleted == 0:
+                status = (
+                    "modified" if file_added < 50 else "added"
+                )  # Heuristic for new vs modified
+            elif file_deleted > 0 and file_added == 0:
+                status = "deleted"
+            else:
+                status = "modified"
 
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                parts = line.split("\t")
-                if len(parts) >= 3:
-                    try:
-                        file_added = 0 if parts[0] == "-" else int(parts[0])
-                        file_deleted = 0 if parts[1] == "-" else int(parts[1])
-                        file_path = parts[2]
-
-                        added += file_added
-                        deleted += file_deleted
-                        files_changed += 1
-
-                        # Determine file status
-                        if file_added > 0 and file_deleted == 0:
-                            status = (
-                                "modified" if file_added < 50 else "added"
-                            )  # Heuristic for new vs modified
-                        elif file_deleted > 0 and file_added == 0:
-                            status = "deleted"
-                        else:
-                            status = "modified"
-
-                        file_stats.append(
-                            {
-                                "file": file_path,
-                                "added": file_added,
-                                "deleted": file_deleted,
-                                "status": status,
-                            }
-                        )
-                    except ValueError:
-                        continue
+            file_path = os.fsdecode(raw_path)
+            file_stats.append(
+                {
+                    "file": file_path,
+                    "added": file_added,
+                    "deleted": file_deleted,
+                    "status": status,
+                }
+            )
+            if raw_old_path:
+                paths.append(os.fsdecode(raw_old_path))
+            paths.append(file_path)
 
         # Add untracked files to file_stats
         for file_path, line_count in untracked_info.get("file_details", []):
             file_stats.append(
                 {"file": file_path, "added": line_count, "deleted": 0, "status": "new"}
             )
+            paths.append(file_path)
 
         return {
             "total_changes": added + deleted,
@@ -102,183 +174,201 @@ class GitStats:
             "untracked": untracked_info["file_count"],
             "untracked_lines": untracked_info["line_count"],
             "file_stats": file_stats,
+            "paths": paths,
         }
 
     @staticmethod
     def get_stats(directory: Path) -> Optional[Dict]:
         """Get git statistics for a directory"""
-        if not GitStats.is_git_repo(directory):
-            return None
-
         try:
-            # Count untracked files and lines
-            untracked_info = GitStats._get_untracked_info(directory)
-
-            # Check if HEAD exists (repository has commits)
-            head_exists = (
-                subprocess.run(
-                    ["git", "-C", str(directory), "rev-parse", "--verify", "HEAD"],
-                    capture_output=True,
-                    check=False,
-                ).returncode
-                == 0
-            )
+            # One `git status` answers "is this a repo", "does HEAD exist"
+            # and "which files are untracked"
+            status = GitStats._collect_status(directory)
+            if status is None:
+                return None
 
-            if not head_exists:
-                # New repository with no commits
-                return GitStats._process_new_repository_stats(directory, untracked_info)
-            else:
-                # Existing repository with commits
-                return GitStats._process_diff_stats(directory, untracked_info)
+            stats = GitStats._stats_from_status(directory, status)
+            # Committing needs the branch too, and status already knows it
+            stats["branch"] = status["branch"]
+            return stats
 
         except subprocess.CalledProcessError:
             return None
 
     @staticmethod
-    def is_git_repo(directory: Path) -> bool:
-        """Check if directory is a git repository"""
-        try:
-            subprocess.run(
-                ["git", "-C", str(directory), "rev-parse", "--git-dir"],
-                capture_output=True,
-                check=True,
+    def _stats_from_status(directory: Path, status: dict) -> dict:
+        """Build the stats for a repository from its summarized status"""
+        if status["head_exists"] and not status["tracked_changes"]:
+            # Nothing tracked differs from HEAD, so the diff would be empty
+            untracked_info = GitStats._get_untracked_info(
+                directory, status["untracked"]
             )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            return GitStats._process_diff_stats(directory, untracked_info, b"")
+
+        if status["head_exists"] and status["untracked"]:
+            # The diff only waits on git and counting only reads files,
+            # so let git run while the untracked files are read
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                numstat = pool.submit(GitStats._get_numstat, directory)
+                untracked_info = GitStats._get_untracked_info(
+                    directory, status["untracked"]
+                )
+                return GitStats._process_diff_stats(
+                    directory, untracked_info, numstat.result()
+                )
+
+        # Count untracked files and lines
+        untracked_info = GitStats._get_untracked_info(directory, status["untracked"])
+
+        if not status["head_exists"]:
+            # New repository with no commits
+            return GitStats._process_new_repository_stats(
+                directory, untracked_info, status["staged"]
+            )
+        else:
+            # Existing repository with commits
+            return GitStats._process_diff_stats(directory, untracked_info)
 
     @staticmethod
-    def _get_untracked_info(directory: Path) -> dict:
-        """Get info about untracked files (count and total lines)"""
-        try:
-            # Get list of untracked files
-            result = subprocess.run(
-                [
-                    "git",
-                    "-C",
-                    str(directory),
-                    "ls-files",
-                    "--others",
-                    "--exclude-standard",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+    def _collect_status(directory: Path) -> Optional[dict]:
+        """Run a single porcelain `git status` and summarize it
 
-            untracked_files = [
-                line for line in result.stdout.strip().split("\n") if line
-            ]
-            if not untracked_files:
-                return {"file_count": 0, "line_count": 0, "file_details": []}
+        Returns None if the directory is not inside a git repository.
+        """
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(directory),
+                "status",
+                "--porcelain=v2",
+                "-z",
+                "--branch",
+                "--untracked-files=all",
+                "--",
+                ".",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        if result.returncode != 0:
+            return None
 
-            total_lines = 0
-            file_details = []
+        head_exists = True
+        branch = ""
+        tracked_changes = False
+        untracked = []
+        staged = []
+        prefix = None
+        records = iter(result.stdout.split(b"\0"))
+        for record in records:
+            if record.startswith(b"? "):
+                # Porcelain paths are relative to the worktree root; make them
+                # relative to the monitored directory like `git ls-files` does
+                if prefix is None:
+                    prefix = GitStats._worktree_prefix(directory)
+                untracked.append(os.fsdecode(record[2:])[len(prefix) :])
+            elif record.startswith(b"1 "):
+                tracked_changes = True
+                # "1 XY sub mH mI mW hH hI path"; X is the index side
+                if record[2:3] != b".":
+                    if prefix is None:
+                        prefix = GitStats._worktree_prefix(directory)
+                    path = record.split(b" ", 8)[8]
+                    staged.append(os.fsdecode(path)[len(prefix) :])
+            elif record.startswith(b"2 "):
+                tracked_changes = True
+                # Rename/copy entries carry the original path as an extra field
+                next(records, None)
+            elif record.startswith(b"u "):
+                tracked_changes = True
+            elif record.startswith(b"# branch.head "):
+                branch = os.fsdecode(record[14:])
+            elif record == b"# branch.oid (initial)":
+                head_exists = False
 
-            for file_path in untracked_files:
-                full_path = directory / file_path
-                try:
-                    # Only count text files, skip binary files
-                    with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = sum(1 for _ in f)
-                        total_lines += lines
-                        file_details.append((file_path, lines))
-                except (OSError, UnicodeDecodeError, PermissionError):
-                    # Skip files we can't read or binary files
-                    # But still count them as 1 line each so they're not ignored
-                    total_lines += 1
-                    file_details.append((file_path, 1))
-
-            return {
-                "file_count": len(untracked_files),
-                "line_count": total_lines,
-                "file_details": file_details,
-            }
-        except subprocess.CalledProcessError:
-            return {"file_count": 0, "line_count": 0, "file_details": []}
+        return {
+            "head_exists": head_exists,
+            # Empty when HEAD is detached, like `git branch --show-current`
+            "branch": "" if branch == "(detached)" else branch,
+            "tracked_changes": tracked_changes,
+            "untracked": untracked,
+            "staged": staged,
+        }
+
+    @staticmethod
+    def _worktree_prefix(directory: Path) -> str:
+        """Get directory's path below its worktree root ("" at the root)"""
+        for candidate in (directory, *directory.parents):
+            if os.path.lexists(candidate / ".git"):
+                relative = directory.relative_to(candidate).as_posix()
+                return "" if relative == "." else f"{relative}/"
+
+        # Unusual layouts (GIT_DIR, relative paths) - let git work it out
+        return subprocess.run(
+            ["git", "-C", str(directory), "rev-parse", "--show-prefix"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        ).stdout.strip()
 
     @staticmethod
-    def _get_staged_new_files_info(directory: Path) -> dict:
-        """Get info about staged new files (files that are staged but not yet committed)"""
+    def is_git_repo(directory: Path) -> bool:
+        """Check if directory is a git repository"""
+        # A repo root answers without forking git; subdirectories and
+        # worktrees go through libgit2 or rev-parse
+        if os.path.lexists(directory / ".git"):
+            return True
+        if pygit2 is not None and "GIT_DIR" not in os.environ:
+            # libgit2 does the same upward search in-process, but does not
+            # honour GIT_DIR
+            try:
+                return pygit2.discover_repository(str(directory)) is not None
+            except (KeyError, pygit2.GitError):
+                pass
         try:
-            # Get list of staged files
-            result = subprocess.run(
-                ["git", "-C", str(directory), "diff", "--staged", "--name-only"],
-                capture_output=True,
-                text=True,
+            subprocess.run(
+                ["git", "-C", str(directory), "rev-parse", "--git-dir"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
-
-            staged_files = [line for line in result.stdout.strip().split("\n") if line]
-            if not staged_files:
-                return {"file_count": 0, "line_count": 0, "file_details": []}
-
-            total_lines = 0
-            file_details = []
-
-            for file_path in staged_files:
-                full_path = directory / file_path
-                try:
-                    # Only count text files, skip binary files
-                    with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = sum(1 for _ in f)
-                        total_lines += lines
-                        file_details.append((file_path, lines))
-                except (OSError, UnicodeDecodeError, PermissionError):
-                    # Skip files we can't read or binary files
-                    # But still count them as 1 line each so they're not ignored
-                    total_lines += 1
-                    file_details.append((file_path, 1))
-
-            return {
-                "file_count": len(staged_files),
-                "line_count": total_lines,
-                "file_details": file_details,
-            }
+            return True
         except subprocess.CalledProcessError:
-            return {"file_count": 0, "line_count": 0, "file_details": []}
+            return False
 
     @staticmethod
-    def _count_untracked(directory: Path) -> int:
-        """Count lines in untracked files"""
-        try:
-            # Get list of untracked files
-            result = subprocess.run(
-                [
-                    "git",
-                    "-C",
-                    str(directory),
-                    "ls-files",
-                    "--others",
-                    "--exclude-standard",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+    def _count_file_lines(directory: Path, file_paths: list) -> dict:
+        """Count lines in files given relative to directory"""
+        total_lines = 0
+        file_details = []
+
+        for file_path in file_paths:
+            full_path = directory / file_path
+            try:
+                # Only count text files, skip binary files
+                with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
+                    lines = sum(1 for _ in f)
+                    total_lines += lines
+                    file_details.append((file_path, lines))
+            except (OSError, UnicodeDecodeError, PermissionError):
+                # Skip files we can't read or binary files
+                # But still count them as 1 line each so they're not ignored
+                total_lines += 1
+                file_details.append((file_path, 1))
 
-            untracked_files = [
-                line for line in result.stdout.strip().split("\n") if line
-            ]
-            if not untracked_files:
-                return 0
+        return {
+            "file_count": len(file_paths),
+            "line_count": total_lines,
+            "file_details": file_details,
+        }
 
-            total_lines = 0
-            for file_path in untracked_files:
-                full_path = directory / file_path
-                try:
-                    # Only count text files, skip binary files
-                    with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = sum(1 for _ in f)
-                        total_lines += lines
-                except (OSError, UnicodeDecodeError, PermissionError):
-                    # Skip files we can't read or binary files
-                    # But still count them as 1 line each so they're not ignored
-                    total_lines += 1
-
-            return total_lines
-        except subprocess.CalledProcessError:
-            return 0
+    @staticmethod
+    def _get_untracked_info(directory: Path, untracked_files: list) -> dict:
+        """Get info about untracked files (count and total lines)"""
+        return GitStats._count_file_lines(directory, untracked_files)
 
     @staticmethod
     def format_file_changes(file_stats: list, max_files: int = 5) -> str:
@@ -324,7 +414,7 @@ class GitStats:
     @staticmethod
     def create_enhanced_commit_message(name: str, stats: dict, threshold: int) -> str:
         """Create an enhanced commit message with per-file statistics"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         total_changes = stats["total_changes"] + stats.get(
             "untracked_lines", stats["untracked"]
         )
@@ -364,25 +454,35 @@ Auto-committed by DOH monitoring system.
 
     @staticmethod
     def get_or_create_temp_branch(
-        directory: Path, prefix: str = "doh-auto-commits"
+        directory: Path,
+        prefix: str = "doh-auto-commits",
+        current_branch: Optional[str] = None,
     ) -> str:
-        """Get existing temp branch or create a new one"""
+        """Get existing temp branch or create a new one
+
+        Pass current_branch when it is already known (get_stats() reports
+        it) to skip asking git for it.
+        """
+        git_cmd = ["git", "-C", str(directory)]
         try:
             # Check if we're already on a temp branch
-            current_branch = subprocess.run(
-                ["git", "-C", str(directory), "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            ).stdout.strip()
+            if current_branch is None:
+                current_branch = subprocess.run(
+                    git_cmd + ["branch", "--show-current"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    check=True,
+                ).stdout.strip()
 
             if current_branch.startswith(prefix):
                 return current_branch
 
             # Look for existing temp branches
             result = subprocess.run(
-                ["git", "-C", str(directory), "branch", "--list", f"{prefix}-*"],
-                capture_output=True,
+                git_cmd + ["branch", "--list", f"{prefix}-*"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 check=True,
             )
@@ -399,13 +499,14 @@ Auto-committed by DOH monitoring system.
                 return latest_branch
 
             # Create new temp branch with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
             branch_name = f"{prefix}-{timestamp}"
 
             # Create and checkout new branch
             subprocess.run(
-                ["git", "-C", str(directory), "checkout", "-b", branch_name],
-                capture_output=True,
+                git_cmd + ["checkout", "-b", branch_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
@@ -420,74 +521,88 @@ Auto-committed by DOH monitoring system.
         try:
             subprocess.run(
                 ["git", "-C", str(directory), "checkout", branch_name],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             return True
         except subprocess.CalledProcessError:
             return False
 
+    @staticmethod
+    def _for_each_temp_branch(directory: Path, prefix: str, fields: str = "") -> list:
+        """Run one `git for-each-ref` over the temp branches
+
+        Returns one list of NUL-separated fields per branch, starting
+        with the branch name, sorted by name like `git branch --list`.
+        """
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(directory),
+                "for-each-ref",
+                f"--format=%(refname:short){fields}",
+                f"refs/heads/{prefix}-*",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+        lines = result.stdout.splitlines()
+        return [line.split("\0") for line in lines if line]
+
+    @staticmethod
+    def list_temp_branch_names(
+        directory: Path, prefix: str = "doh-auto-commits"
+    ) -> list:
+        """List temp branch names only, with a single git call"""
+        try:
+            return [
+                fields[0]
+                for fields in GitStats._for_each_temp_branch(directory, prefix)
+            ]
+        except subprocess.CalledProcessError:
+            return []
+
     @staticmethod
     def list_temp_branches(directory: Path, prefix: str = "doh-auto-commits") -> list:
         """List all temp branches in the repository"""
+        git_cmd = ["git", "-C", str(directory)]
         try:
-            result = subprocess.run(
-                ["git", "-C", str(directory), "branch", "--list", f"{prefix}-*"],
-                capture_output=True,
-                text=True,
-                check=True,
+            # Names and last commit dates come from one for-each-ref; only
+            # the commit count still needs a call per branch
+            refs = GitStats._for_each_temp_branch(
+                directory, prefix, "%00%(committerdate:relative)"
             )
 
             branches = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    branch = line.strip().replace("* ", "")
-                    # Get commit count and last commit info
-                    try:
-                        commit_count = subprocess.run(
-                            [
-                                "git",
-                                "-C",
-                                str(directory),
-                                "rev-list",
-                                "--count",
-                                branch,
-                            ],
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                        ).stdout.strip()
-
-                        last_commit = subprocess.run(
-                            [
-                                "git",
-                                "-C",
-                                str(directory),
-                                "log",
-                                "-1",
-                                "--format=%cr",
-                                branch,
-                            ],
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                        ).stdout.strip()
-
-                        branches.append(
-                            {
-                                "name": branch,
-                                "commit_count": int(commit_count),
-                                "last_commit": last_commit,
-                            }
-                        )
-                    except subprocess.CalledProcessError:
-                        branches.append(
-                            {
-                                "name": branch,
-                                "commit_count": 0,
-                                "last_commit": "unknown",
-                            }
-                        )
+            for branch, last_commit in refs:
+                try:
+                    commit_count = subprocess.run(
+                        git_cmd + ["rev-list", "--count", branch],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        check=True,
+                    ).stdout.strip()
+
+                    branches.append(
+                        {
+                            "name": branch,
+                            "commit_count": int(commit_count),
+                            "last_commit": last_commit,
+                        }
+                    )
+                except subprocess.CalledProcessError:
+                    branches.append(
+                        {
+                            "name": branch,
+                            "commit_count": 0,
+                            "last_commit": "unknown",
+                        }
+                    )
 
             return branches
 
@@ -502,12 +617,14 @@ Auto-committed by DOH monitoring system.
         temp_branch: Optional[str] = None,
     ) -> bool:
         """Squash temp branch commits into target branch with a proper commit message"""
+        git_cmd = ["git", "-C", str(directory)]
         try:
             if not temp_branch:
                 # Find the current temp branch
                 current_branch = subprocess.run(
-                    ["git", "-C", str(directory), "branch", "--show-current"],
-                    capture_output=True,
+                    git_cmd + ["branch", "--show-current"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     text=True,
                     check=True,
                 ).stdout.strip()
@@ -518,29 +635,33 @@ Auto-committed by DOH monitoring system.
 
             # Switch to target branch
             subprocess.run(
-                ["git", "-C", str(directory), "checkout", target_branch],
-                capture_output=True,
+                git_cmd + ["checkout", target_branch],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
             # Squash merge the temp branch
             subprocess.run(
-                ["git", "-C", str(directory), "merge", "--squash", temp_branch],
-                capture_output=True,
+                git_cmd + ["merge", "--squash", temp_branch],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
             # Commit with the provided message
             subprocess.run(
-                ["git", "-C", str(directory), "commit", "-m", commit_message],
-                capture_output=True,
+                git_cmd + ["commit", "--quiet", "-m", commit_message],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
             # Delete the temp branch
             subprocess.run(
-                ["git", "-C", str(directory), "branch", "-D", temp_branch],
-                capture_output=True,
+                git_cmd + ["branch", "-D", temp_branch],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
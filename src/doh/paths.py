@@ -0,0 +1,41 @@
+"""
+Filesystem helpers for DOH
+"""
+
+import os
+from collections import defaultdict
+from typing import Iterable, Set
+
+
+def existing_paths(paths: Iterable[str]) -> Set[str]:
+    """Return the subset of paths that exist, reading each parent dir once
+
+    Monitored directories tend to share a parent (~/src/*), so one
+    scandir of the parent replaces a stat per entry. Only names listed
+    as directories are trusted; anything else (case-insensitive
+    filesystems, files, dangling symlinks) and parents that cannot be
+    listed fall back to os.path.exists().
+    """
+    by_parent = defaultdict(list)
+    for path in paths:
+        by_parent[os.path.dirname(path)].append(path)
+
+    existing = set()
+    for parent, children in by_parent.items():
+        if len(children) == 1:
+            # One stat is cheaper than listing a directory for one entry
+            if os.path.exists(children[0]):
+                existing.add(children[0])
+            continue
+
+        try:
+            with os.scandir(parent) as entries:
+                dirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            dirs = set()
+
+        for path in children:
+            if os.path.basename(path) in dirs or os.path.exists(path):
+                existing.add(path)
+
+    return existing
@@ -6,76 +6,85 @@ This module contains all the functions responsible for displaying
 status information in various formats (local, global, detailed).
 """
 
+import os
 from pathlib import Path
+from typing import Optional
 import click
 from .colors import Colors
 from .config import DEFAULT_THRESHOLD
-from .git_stats import GitStats
+from .git_stats import GitStats, map_directories
+from .paths import existing_paths
 
+# Fixed status labels; Colors is settled at import, so build them once
+CLEAN_LABEL = f"{Colors.GREEN}CLEAN{Colors.RESET}"
+NOT_A_REPO_LABEL = f"{Colors.RED}NOT A GIT REPO{Colors.RESET}"
+NOT_FOUND_LABEL = f"{Colors.RED}DIRECTORY NOT FOUND{Colors.RESET}"
 
-def show_single_directory_status(directory: Path, doh_core):
-    """Helper function to show status of a single directory"""
-    data = doh_core.config.load()
-    directories = data.get("directories", {})
 
-    if str(directory) not in directories:
+def show_single_directory_status(
+    directory: Path, doh_core, stats: Optional[dict] = None
+):
+    """Helper function to show status of a single directory from its stats"""
+    info = doh_core.get_monitored(directory)
+    if info is None:
         click.echo(f"{Colors.RED}Directory not monitored{Colors.RESET}")
         return
 
-    info = directories[str(directory)]
     name = info.get("name", directory.name)
     threshold = info.get("threshold", DEFAULT_THRESHOLD)
 
     # Get git stats
-    stats = GitStats.get_stats(directory)
+    if stats is None:
+        stats = GitStats.get_stats(directory)
 
     if stats is None:
-        status = f"{Colors.RED}NOT A GIT REPO{Colors.RESET}"
-        click.echo(f"  {Colors.BLUE}{name}{Colors.RESET}: {status}")
+        click.echo(f"  {Colors.BLUE}{name}{Colors.RESET}: {NOT_A_REPO_LABEL}")
     elif not directory.exists():
-        status = f"{Colors.RED}DIRECTORY NOT FOUND{Colors.RESET}"
-        click.echo(f"  {Colors.BLUE}{name}{Colors.RESET}: {status}")
+        click.echo(f"  {Colors.BLUE}{name}{Colors.RESET}: {NOT_FOUND_LABEL}")
     else:
-        total_changes = stats["total_changes"]
-        untracked_lines = stats.get("untracked_lines", stats["untracked"])
-        total_all = total_changes + untracked_lines
-
-        if total_all == 0:
-            status = f"{Colors.GREEN}CLEAN{Colors.RESET}"
-        elif total_all >= threshold:
-            status = (
-                f"{Colors.RED}OVER THRESHOLD "
-                f"({total_all}/{threshold}){Colors.RESET}"
-            )
-        else:
-            status = (
-                f"{Colors.YELLOW}HAS CHANGES "
-                f"({total_all}/{threshold}){Colors.RESET}"
+        click.echo(render_directory_details(name, threshold, stats))
+
+
+def render_directory_details(name: str, threshold: int, stats: dict) -> str:
+    """Render the status block for a monitored repository as one string
+
+    click.echo() flushes on every call, so the block is written at once.
+    """
+    total_changes = stats["total_changes"]
+    untracked_lines = stats.get("untracked_lines", stats["untracked"])
+    total_all = total_changes + untracked_lines
+
+    counts = f"({total_all}/{threshold})"
+    if total_all == 0:
+        status = CLEAN_LABEL
+    elif total_all >= threshold:
+        status = f"{Colors.RED}OVER THRESHOLD {counts}{Colors.RESET}"
+    else:
+        status = f"{Colors.YELLOW}HAS CHANGES {counts}{Colors.RESET}"
+
+    out = [
+        f"  {Colors.BLUE}{name}{Colors.RESET}: {status}",
+        f"    Changes: +{stats['added']} -{stats['deleted']} "
+        f"(files: {stats['files_changed']})",
+    ]
+    if stats["untracked"] > 0:
+        out.append(f"    Untracked: {stats['untracked']} files")
+
+    # Show enhanced file details if there are changes
+    file_stats = stats.get("file_stats", [])
+    if file_stats:
+        file_summary = GitStats.format_file_changes(file_stats, max_files=5)
+        out.append(f"    Files: {file_summary}")
+
+        # Show warning if approaching threshold
+        if total_all >= threshold * 0.8 and total_all < threshold:
+            out.append(
+                f"    {Colors.YELLOW}⚠ Approaching threshold - "
+                f"{threshold - total_all} lines remaining"
+                f"{Colors.RESET}"
             )
 
-        click.echo(f"  {Colors.BLUE}{name}{Colors.RESET}: {status}")
-        changes_msg = (
-            f"    Changes: +{stats['added']} -{stats['deleted']} "
-            f"(files: {stats['files_changed']})"
-        )
-        click.echo(changes_msg)
-        if stats["untracked"] > 0:
-            click.echo(f"    Untracked: {stats['untracked']} files")
-
-        # Show enhanced file details if there are changes
-        file_stats = stats.get("file_stats", [])
-        if file_stats:
-            file_summary = GitStats.format_file_changes(file_stats, max_files=5)
-            click.echo(f"    Files: {file_summary}")
-
-            # Show warning if approaching threshold
-            if total_all >= threshold * 0.8 and total_all < threshold:
-                warning_msg = (
-                    f"    {Colors.YELLOW}⚠ Approaching threshold - "
-                    f"{threshold - total_all} lines remaining"
-                    f"{Colors.RESET}"
-                )
-                click.echo(warning_msg)
+    return "\n".join(out)
 
 
 def show_global_status_summary(total, over_threshold, clean, issues, temp_branches):
@@ -97,13 +106,14 @@ def show_over_threshold_directories(over_threshold):
     if not over_threshold:
         return
 
-    click.echo(f"{Colors.RED}{Colors.BOLD}⚠ OVER THRESHOLD:{Colors.RESET}")
+    out = [f"{Colors.RED}{Colors.BOLD}⚠ OVER THRESHOLD:{Colors.RESET}"]
     for name, path, changes, threshold in over_threshold:
-        click.echo(
+        out.append(
             f"  {Colors.RED}{name}: {changes} changes (threshold: {threshold}){Colors.RESET}"
         )
-        click.echo(f"    {path}")
-    click.echo()
+        out.append(f"    {path}")
+    out.append("")
+    click.echo("\n".join(out))
 
 
 def show_directory_issues(issues):
@@ -111,11 +121,12 @@ def show_directory_issues(issues):
     if not issues:
         return
 
-    click.echo(f"{Colors.YELLOW}{Colors.BOLD}⚠ ISSUES:{Colors.RESET}")
+    out = [f"{Colors.YELLOW}{Colors.BOLD}⚠ ISSUES:{Colors.RESET}"]
     for name, path, issue in issues:
-        click.echo(f"  {Colors.YELLOW}{name}: {issue}{Colors.RESET}")
-        click.echo(f"    {path}")
-    click.echo()
+        out.append(f"  {Colors.YELLOW}{name}: {issue}{Colors.RESET}")
+        out.append(f"    {path}")
+    out.append("")
+    click.echo("\n".join(out))
 
 
 def show_temp_branches_global(temp_branches):
@@ -123,26 +134,26 @@ def show_temp_branches_global(temp_branches):
     if not temp_branches:
         return
 
-    click.echo(
+    out = [
         f"{Colors.BLUE}{Colors.BOLD}🔀 TEMP BRANCHES ({len(temp_branches)} directories):{Colors.RESET}"
-    )
+    ]
     for name, path, branches in temp_branches:
-        click.echo(f"  {Colors.BLUE}{name}:{Colors.RESET}")
+        out.append(f"  {Colors.BLUE}{name}:{Colors.RESET}")
         for branch_info in branches[:3]:  # Show first 3 branches
-            branch_msg = (
+            out.append(
                 f"    {Colors.BLUE}• {branch_info['name']} "
                 f"({branch_info['commit_count']} commits, "
                 f"{branch_info['last_commit']}){Colors.RESET}"
             )
-            click.echo(branch_msg)
         if len(branches) > 3:
-            click.echo(
+            out.append(
                 f"    {Colors.BLUE}... and {len(branches) - 3} more branches{Colors.RESET}"
             )
-        click.echo(
+        out.append(
             f"    {Colors.BLUE}💡 Run 'doh squash \"message\"' in {path} to merge{Colors.RESET}"
         )
-    click.echo()
+    out.append("")
+    click.echo("\n".join(out))
 
 
 def show_clean_directories(clean):
@@ -150,17 +161,17 @@ def show_clean_directories(clean):
     if not clean:
         return
 
-    click.echo(
-        f"{Colors.GREEN}{Colors.BOLD}✓ CLEAN ({len(clean)} directories):{Colors.RESET}"
-    )
+    header = f"✓ CLEAN ({len(clean)} directories):"
+    out = [f"{Colors.GREEN}{Colors.BOLD}{header}{Colors.RESET}"]
     for name, path, changes in clean[:5]:  # Show first 5
         if changes > 0:
-            click.echo(f"  {Colors.GREEN}{name}: {changes} changes{Colors.RESET}")
+            out.append(f"  {Colors.GREEN}{name}: {changes} changes{Colors.RESET}")
         else:
-            click.echo(f"  {Colors.GREEN}{name}: No changes{Colors.RESET}")
+            out.append(f"  {Colors.GREEN}{name}: No changes{Colors.RESET}")
 
     if len(clean) > 5:
-        click.echo(f"  {Colors.GREEN}... and {len(clean) - 5} more{Colors.RESET}")
+        out.append(f"  {Colors.GREEN}... and {len(clean) - 5} more{Colors.RESET}")
+    click.echo("\n".join(out))
 
 
 def categorize_directories(directories):
@@ -170,23 +181,37 @@ def categorize_directories(directories):
     issues = []
     temp_branches = []
 
-    for dir_path, info in directories.items():
-        directory_path = Path(dir_path)
+    existing = existing_paths(directories)
+
+    def collect(dir_path):
+        if dir_path not in existing:
+            return None, None
+        directory = Path(dir_path)
+        stats = GitStats.get_stats(directory)
+        if stats is None:
+            return None, None
+        return stats, GitStats.list_temp_branches(directory)
+
+    # Ask git about every repository up front and concurrently; the
+    # categorizing below only reads the results, in config order
+    results = map_directories(collect, directories)
+
+    for (dir_path, info), (stats, temp_branch_list) in zip(
+        directories.items(), results
+    ):
         # Get name and threshold from directory info
-        name = info.get("name", directory_path.name)
+        name = info.get("name") or os.path.basename(dir_path)
         threshold = info.get("threshold", DEFAULT_THRESHOLD)
 
-        if not directory_path.exists():
+        if dir_path not in existing:
             issues.append((name, dir_path, "Directory not found"))
             continue
 
-        stats = GitStats.get_stats(directory_path)
         if stats is None:
             issues.append((name, dir_path, "Not a git repository"))
             continue
 
         # Check for temp branches
-        temp_branch_list = GitStats.list_temp_branches(directory_path)
         if temp_branch_list:
             temp_branches.append((name, dir_path, temp_branch_list))
 
@@ -202,7 +227,7 @@ def categorize_directories(directories):
 
 def show_global_status(doh_core):
     """Show global status of all monitored directories."""
-    data = doh_core.config.load()
+    data = doh_core.config.load_readonly()
     directories = data.get("directories", {})
 
     if not directories:
@@ -283,7 +308,8 @@ def show_local_file_changes(stats):
     if not stats["file_stats"]:
         return
 
-    click.echo(f"\n{Colors.BOLD}Files Changed:{Colors.RESET}")
+    # One write for the whole block; click.echo() flushes on every call
+    out = [f"\n{Colors.BOLD}Files Changed:{Colors.RESET}"]
     for file_stat in stats["file_stats"][:10]:  # Show first 10 files
         file_path = file_stat["file"]
         added = file_stat["added"]
@@ -291,21 +317,23 @@ def show_local_file_changes(stats):
         status = file_stat["status"]
 
         if status == "new":
-            click.echo(f"  {Colors.GREEN}+ {file_path} (+{added}){Colors.RESET}")
+            out.append(f"  {Colors.GREEN}+ {file_path} (+{added}){Colors.RESET}")
         elif status == "deleted":
-            click.echo(f"  {Colors.RED}- {file_path} (-{deleted}){Colors.RESET}")
+            out.append(f"  {Colors.RED}- {file_path} (-{deleted}){Colors.RESET}")
         elif added > 0 and deleted > 0:
-            click.echo(
+            out.append(
                 f"  {Colors.YELLOW}~ {file_path} (+{added}/-{deleted}){Colors.RESET}"
             )
         elif added > 0:
-            click.echo(f"  {Colors.BLUE}~ {file_path} (~{added}){Colors.RESET}")
+            out.append(f"  {Colors.BLUE}~ {file_path} (~{added}){Colors.RESET}")
         else:
-            click.echo(f"  {Colors.YELLOW}~ {file_path} (modified){Colors.RESET}")
+            out.append(f"  {Colors.YELLOW}~ {file_path} (modified){Colors.RESET}")
 
     if len(stats["file_stats"]) > 10:
         remaining = len(stats["file_stats"]) - 10
-        click.echo(f"  {Colors.YELLOW}... and {remaining} more files{Colors.RESET}")
+        out.append(f"  {Colors.YELLOW}... and {remaining} more files{Colors.RESET}")
+
+    click.echo("\n".join(out))
 
 
 def show_local_status(directory, doh_core):
@@ -316,28 +344,23 @@ def show_local_status(directory, doh_core):
     directory = directory.resolve()
 
     # Check if directory is monitored
-    data = doh_core.config.load()
-    directories = data.get("directories", {})
-
-    if str(directory) not in directories:
+    dir_info = doh_core.get_monitored(directory)
+    if dir_info is None:
         show_local_not_monitored(directory)
         return
 
-    # Get directory info
-    dir_info = directories[str(directory)]
     name = dir_info.get("name", directory.name)
     threshold = dir_info.get("threshold", DEFAULT_THRESHOLD)
 
     show_local_status_header(name, directory, threshold)
 
-    if not GitStats.is_git_repo(directory):
-        click.echo(f"{Colors.RED}❌ Not a git repository{Colors.RESET}")
-        return
-
-    # Get git stats
+    # get_stats() fails on non-repos too; only then ask why
     stats = GitStats.get_stats(directory)
     if stats is None:
-        click.echo(f"{Colors.RED}❌ Failed to get git statistics{Colors.RESET}")
+        if not GitStats.is_git_repo(directory):
+            click.echo(f"{Colors.RED}❌ Not a git repository{Colors.RESET}")
+        else:
+            click.echo(f"{Colors.RED}❌ Failed to get git statistics{Colors.RESET}")
         return
 
     total_changes = stats["total_changes"] + stats["untracked"]
@@ -9,9 +9,11 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 from click.testing import CliRunner
 
 # Import CLI commands
+import doh.cli
 from doh.cli import main, config, add, status, list, run, squash, cleanup
 
 
@@ -27,8 +29,24 @@ class TestDohCLI:
         self.original_home = os.environ.get("HOME")
         os.environ["HOME"] = str(self.test_dir)
 
+        # The config path is resolved at import, so HOME alone does not
+        # isolate it; point it at this test's directory and drop the
+        # shared DohCore so the CLI picks up the new location
+        config_dir = self.test_dir / ".doh"
+        self.config_patches = [
+            patch("doh.config.DOH_CONFIG_DIR", config_dir),
+            patch("doh.config.DOH_CONFIG_FILE", config_dir / "config.json"),
+        ]
+        for config_patch in self.config_patches:
+            config_patch.start()
+        doh.cli._doh = None
+
     def teardown_method(self):
         """Clean up after each test"""
+        for config_patch in self.config_patches:
+            config_patch.stop()
+        doh.cli._doh = None
+
         if self.original_home:
             os.environ["HOME"] = self.original_home
         elif "HOME" in os.environ:
@@ -112,8 +130,7 @@ class TestDohCLI:
         """Test list command with no monitored directories"""
         result = self.runner.invoke(list)
         assert result.exit_code == 0
-        # In a real environment, there may be existing directories
-        assert "Monitored Directories:" in result.output
+        assert "No directories being monitored" in result.output
 
     def test_list_command_with_directories(self):
         """Test list command shows monitored directories"""
@@ -196,6 +213,192 @@ class TestDohCLI:
         # Don't assert specific count since there may be existing monitored directories
         assert "Checking" in result.output and "monitored directories" in result.output
 
+    def test_run_command_multiple_directories(self):
+        """Test run reports every directory in config order"""
+        first = self.test_dir / "first_repo"
+        second = self.test_dir / "second_repo"
+        self.create_git_repo(first)
+        self.create_git_repo(second)
+
+        self.runner.invoke(add, [str(first), "--threshold", "100"])
+        self.runner.invoke(add, [str(second), "--threshold", "100"])
+        shutil.rmtree(second)
+
+        result = self.runner.invoke(run, ["--verbose"])
+        assert result.exit_code == 0
+        first_line = result.output.index("first_repo: 0 changes")
+        second_line = result.output.index("Directory not found: second_repo")
+        assert first_line < second_line
+
+    def test_run_output_order_around_commits(self):
+        """Test buffered status lines are written before a commit's output"""
+        quiet = self.test_dir / "quiet_repo"
+        busy = self.test_dir / "busy_repo"
+        later = self.test_dir / "later_repo"
+        self.create_git_repo(quiet)
+        self.create_git_repo(busy, with_changes=True)
+        self.create_git_repo(later)
+
+        self.runner.invoke(add, [str(quiet), "--threshold", "100"])
+        self.runner.invoke(add, [str(busy), "--threshold", "1"])
+        self.runner.invoke(add, [str(later), "--threshold", "100"])
+
+        result = self.runner.invoke(run, ["--verbose"])
+        assert result.exit_code == 0
+        # Only this test's repositories are in the config
+        assert "Checking 3 monitored directories" in result.output
+        assert "Auto-committed 1 directories" in result.output
+        quiet_line = result.output.index("quiet_repo: 0 changes")
+        busy_line = result.output.index("busy_repo")
+        later_line = result.output.index("later_repo: 0 changes")
+        assert quiet_line < busy_line < later_line
+
+    def test_run_commits_deletions_and_new_files(self):
+        """Test run stages staged deletions and untracked files it reported"""
+        repo_dir = self.test_dir / "stage_repo"
+        self.create_git_repo(repo_dir)
+        (repo_dir / "extra.txt").write_text("extra\n")
+        subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
+        subprocess.run(["git", "commit", "-m", "extra"], cwd=repo_dir, check=True)
+
+        subprocess.run(["git", "rm", "-q", "extra.txt"], cwd=repo_dir, check=True)
+        (repo_dir / "README.md").unlink()
+        (repo_dir / "new.txt").write_text("one\ntwo\n")
+
+        self.runner.invoke(add, [str(repo_dir), "--threshold", "1"])
+        result = self.runner.invoke(run, ["--verbose"])
+        assert result.exit_code == 0
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert status.stdout == ""
+
+    def test_run_commits_untracked_nested_repository(self):
+        """Test run stages a nested repository that update-index would skip"""
+        repo_dir = self.test_dir / "outer_repo"
+        self.create_git_repo(repo_dir)
+        self.create_git_repo(repo_dir / "nested")
+
+        self.runner.invoke(add, [str(repo_dir), "--threshold", "1"])
+        result = self.runner.invoke(run, ["--verbose"])
+        assert result.exit_code == 0
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert status.stdout == ""
+
+    def test_run_refreshes_stats_after_commit_in_same_repo(self):
+        """Test a directory inside an already committed repo is re-checked"""
+        repo_dir = self.test_dir / "parent_repo"
+        self.create_git_repo(repo_dir)
+        sub_dir = repo_dir / "sub"
+        sub_dir.mkdir()
+        (sub_dir / "f").write_text("line\n" * 60)
+
+        self.runner.invoke(config, ["--set", "--no-temp-branches"])
+        self.runner.invoke(add, [str(repo_dir), "--threshold", "10"])
+        self.runner.invoke(add, [str(sub_dir), "--threshold", "10"])
+
+        result = self.runner.invoke(run, ["--verbose"])
+        assert result.exit_code == 0
+        assert "Auto-committed 'parent_repo'" in result.output
+        assert "sub: 0 changes (under threshold 10)" in result.output
+        assert "Failed to commit" not in result.output
+
+    def test_main_monitored_directory_reuses_stats(self):
+        """Test the no-subcommand status path runs get_stats only once"""
+        from doh.git_stats import GitStats
+
+        repo_dir = self.test_dir / "smart_repo"
+        self.create_git_repo(repo_dir, with_changes=True)
+        self.runner.invoke(add, [str(repo_dir), "--threshold", "100"])
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(repo_dir)
+            with patch.object(
+                GitStats, "get_stats", wraps=GitStats.get_stats
+            ) as mock_stats:
+                result = self.runner.invoke(main)
+            assert result.exit_code == 0
+            assert "HAS CHANGES" in result.output
+            assert mock_stats.call_count == 1
+        finally:
+            os.chdir(old_cwd)
+
+    def test_main_auto_commit_reuses_stats(self):
+        """Test the over-threshold path hands its stats to the commit"""
+        from doh.git_stats import GitStats
+
+        repo_dir = self.test_dir / "smart_commit_repo"
+        self.create_git_repo(repo_dir, with_changes=True)
+        self.runner.invoke(add, [str(repo_dir), "--threshold", "1"])
+
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(repo_dir)
+            with patch.object(
+                GitStats, "get_stats", wraps=GitStats.get_stats
+            ) as mock_stats:
+                result = self.runner.invoke(main)
+            assert result.exit_code == 0
+            assert "committed successfully" in result.output
+            # Once for the threshold check, once for the status after commit
+            assert mock_stats.call_count == 2
+        finally:
+            os.chdir(old_cwd)
+
+    def test_git_profile_args(self):
+        """Test profile options are only added for an existing profile file"""
+        from doh.git_operations import git_profile_args
+
+        profile = self.test_dir / "profile.gitconfig"
+        profile.write_text("[user]\n\tname = Profile User\n")
+
+        assert git_profile_args("") == ()
+        assert git_profile_args(str(self.test_dir / "missing")) == ()
+        assert git_profile_args(str(profile)) == (
+            "-c",
+            f"include.path={profile}",
+        )
+
+    def test_force_commit_directory_clean_and_dirty(self):
+        """Test force commits report whether anything was committed"""
+        from doh.cli import get_doh
+        from doh.git_operations import force_commit_directory
+        from doh.git_stats import GitStats
+
+        repo_dir = self.test_dir / "force_repo"
+        self.create_git_repo(repo_dir)
+
+        # A clean tree is settled from the stats alone, without running git
+        stats = GitStats.get_stats(repo_dir)
+        with patch("subprocess.run") as mock_run:
+            assert force_commit_directory(repo_dir, get_doh(), stats) is False
+            mock_run.assert_not_called()
+
+        (repo_dir / "new.txt").write_text("one\n")
+        assert force_commit_directory(repo_dir, get_doh()) is True
+
+        log = subprocess.run(
+            ["git", "log", "--oneline"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert len(log.stdout.splitlines()) == 2
+
     def test_ex_commands(self):
         """Test exclusion (ex) commands"""
         excluded_dir = self.test_dir / "excluded"
@@ -64,6 +64,26 @@ class TestColors:
             sys.modules.clear()
             sys.modules.update(original_modules)
 
+    def test_no_color_disables_colors_on_tty(self):
+        """Test NO_COLOR wins even when stdout is a terminal"""
+        original_modules = sys.modules.copy()
+
+        try:
+            if "doh.colors" in sys.modules:
+                del sys.modules["doh.colors"]
+
+            with patch.dict("os.environ", {"NO_COLOR": "1"}), patch(
+                "sys.stdout.isatty", return_value=True
+            ):
+                import doh.colors
+
+                assert doh.colors.Colors.RED == ""
+                assert doh.colors.Colors.RESET == ""
+
+        finally:
+            sys.modules.clear()
+            sys.modules.update(original_modules)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ Additional test suite for DOH Config module edge cases
 """
 
 import json
+import os
 import pytest
 import sys
 import tempfile
@@ -142,6 +143,220 @@ class TestConfigEdgeCases:
             backup_files = list(config_dir.glob("config_backup_*.json"))
             assert len(backup_files) > 0
 
+    def test_load_uses_cache_until_file_changes(self):
+        """Test parsed config is reused until the file on disk changes"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({"directories": {"a": {}}}))
+
+            config = DohConfig()
+            config.config_file = config_file
+
+            first = config.load_readonly()
+            with patch("builtins.open") as mock_open:
+                assert config.load_readonly() is first
+                mock_open.assert_not_called()
+
+            # load() hands out copies so callers can mutate freely
+            copied = config.load()
+            copied["directories"]["b"] = {}
+            assert "b" not in config.load_readonly()["directories"]
+
+            # An external rewrite changes size/mtime and forces a reparse
+            config_file.write_text(json.dumps({"directories": {"a": {}, "c": {}}}))
+            assert "c" in config.load_readonly()["directories"]
+
+    def test_save_refreshes_cache(self):
+        """Test save() replaces the cached config with the saved data"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DohConfig()
+            config.config_file = Path(temp_dir) / "config.json"
+
+            data = config.load()
+            data["directories"]["new"] = {"threshold": 10}
+            assert config.save(data)
+
+            # Mutating the caller's dict after saving must not leak into the cache
+            data["directories"]["other"] = {}
+            cached = config.load_readonly()
+            assert "new" in cached["directories"]
+            assert "other" not in cached["directories"]
+
+    def test_save_caches_normalized_config(self):
+        """Test a partial config saved in-process loads with every section"""
+        from doh.core import DohCore
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doh = DohCore()
+            doh.config.config_file = Path(temp_dir) / "config.json"
+
+            assert doh.config.save({"directories": {}})
+            assert doh.add_exclusion(Path(temp_dir))
+            assert temp_dir in doh.config.load_readonly()["exclusions"]
+
+    def test_stdlib_json_fallback_roundtrip(self):
+        """Test config round-trips when fast JSON backends are disabled"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DohConfig()
+            config.config_file = Path(temp_dir) / "config.json"
+
+            with patch("doh.config.USE_FAST_JSON", False):
+                data = config.load()
+                data["directories"]["/tmp/ünïcode"] = {"threshold": 5}
+                assert config.save(data)
+
+                # Written file must stay plain, human-readable JSON
+                on_disk = json.loads(config.config_file.read_text())
+                assert on_disk["directories"]["/tmp/ünïcode"]["threshold"] == 5
+
+                config._cache_key = None
+                assert "/tmp/ünïcode" in config.load()["directories"]
+
+    def test_ujson_keeps_paths_readable(self):
+        """Test the ujson backend writes paths without escaping slashes"""
+        pytest.importorskip("ujson")
+        from doh.config import _json_dumps
+
+        with patch("doh.config.orjson", None):
+            raw = _json_dumps({"directories": {"/home/user/src": {}}})
+
+        assert b'"/home/user/src"' in raw
+
+    def test_large_config_load(self):
+        """Test configs above the mmap threshold load like small ones"""
+        from doh.config import DohConfig, MMAP_MIN_SIZE
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            directories = {
+                f"/home/user/project{i}": {"name": f"project{i}", "threshold": 50}
+                for i in range(2000)
+            }
+            config_file.write_text(json.dumps({"directories": directories}))
+            assert config_file.stat().st_size >= MMAP_MIN_SIZE
+
+            config = DohConfig()
+            config.config_file = config_file
+
+            result = config.load()
+            assert result["directories"] == directories
+            assert "global_settings" in result
+
+    def test_load_exclusions_set(self):
+        """Test exclusions come back as a frozenset for dict and list configs"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config = DohConfig()
+            config.config_file = config_file
+
+            config_file.write_text(
+                json.dumps({"exclusions": {"/a": {"excluded": "now"}}})
+            )
+            first = config.load_exclusions()
+            assert first == frozenset({"/a"})
+            assert config.load_exclusions() is first
+
+            # Older configs stored exclusions as a plain list
+            config_file.write_text(json.dumps({"exclusions": ["/a", "/bb"]}))
+            assert config.load_exclusions() == frozenset({"/a", "/bb"})
+
+    def test_legacy_list_exclusions_can_be_extended(self):
+        """Test a config with list exclusions accepts new exclusions"""
+        from doh.core import DohCore
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({"exclusions": ["/old"]}))
+
+            doh = DohCore()
+            doh.config.config_file = config_file
+
+            assert doh.config.load()["exclusions"] == {"/old": {}}
+            assert doh.add_exclusion(Path(temp_dir))
+            exclusions = json.loads(config_file.read_text())["exclusions"]
+            assert set(exclusions) == {"/old", temp_dir}
+
+    def test_save_is_atomic_and_backs_up_once(self):
+        """Test saves replace the file atomically and rotate backups once"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({"directories": {"first": {}}}))
+
+            config = DohConfig()
+            config.config_file = config_file
+
+            assert config.save({"directories": {"second": {}}})
+            assert config.save({"directories": {"third": {}}})
+
+            backup1 = config_file.with_suffix(".json.backup.1")
+            assert "first" in json.loads(backup1.read_text())["directories"]
+            assert not config_file.with_suffix(".json.backup.2").exists()
+            assert not list(Path(temp_dir).glob("*.tmp"))
+            assert "third" in json.loads(config_file.read_text())["directories"]
+
+    def test_failed_save_keeps_existing_config(self):
+        """Test a save that fails before the rename keeps the old config"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({"directories": {"first": {}}}))
+
+            config = DohConfig()
+            config.config_file = config_file
+
+            real_replace = os.replace
+
+            def crash_on_publish(src, dst):
+                # Fail only the rename that publishes the new config
+                if str(src).endswith(".tmp"):
+                    raise OSError("crash")
+                real_replace(src, dst)
+
+            with patch("doh.config.os.replace", side_effect=crash_on_publish):
+                assert not config.save({"directories": {"second": {}}})
+
+            on_disk = json.loads(config_file.read_text())
+            assert "first" in on_disk["directories"]
+            assert not list(Path(temp_dir).glob("*.tmp"))
+
+    def test_setup_first_run_only_once(self):
+        """Test first-run setup writes the config once and is skipped after"""
+        from doh.config import DohConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DohConfig()
+            config.config_dir = Path(temp_dir)
+            config.config_file = Path(temp_dir) / "config.json"
+
+            # No systemd here, so no timer file is ever written
+            with patch.object(
+                config, "_setup_systemd_daemon", return_value=False
+            ) as mock_daemon:
+                assert config.setup_first_run()
+                assert config.config_file.exists()
+                assert mock_daemon.call_count == 1
+
+                assert config.setup_first_run()
+                assert mock_daemon.call_count == 1
+
+                # A config from before the marker still gets the daemon once
+                config.config_file.write_text('{"directories": {"kept": {}}}')
+                assert config.setup_first_run()
+                assert config.setup_first_run()
+                assert mock_daemon.call_count == 2
+                assert "kept" in config.load_readonly()["directories"]
+
     def test_git_profile_validation(self):
         """Test git profile path validation"""
         from doh.config import DohConfig
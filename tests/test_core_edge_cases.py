@@ -127,6 +127,37 @@ class TestCoreEdgeCases:
         excluded_parent = doh.find_excluded_parent(child_dir)
         assert excluded_parent == parent_dir.resolve()
 
+    def test_find_excluded_string_walk(self):
+        """Test the exclusion walk matches Path.parents semantics"""
+        from doh.core import _find_excluded
+
+        exclusions = frozenset({"/", "/opt/tools", "."})
+        assert _find_excluded("/opt/tools/sub/dir", exclusions) == "/opt/tools"
+        assert _find_excluded("/home/user", exclusions) == "/"
+        assert _find_excluded("/opt/tools", frozenset({"/opt"})) == "/opt"
+        assert _find_excluded("/opt/toolsmith", frozenset({"/opt/tools"})) is None
+        assert _find_excluded("rel/path", exclusions) == "."
+        assert _find_excluded("/home/user", frozenset({"/other"})) is None
+
+    def test_add_exclusion_replaces_monitoring_in_one_save(self):
+        """Test excluding a monitored directory writes the config once"""
+        doh = DohCore()
+        doh.config.config_file = self.test_dir / "config.json"
+
+        monitored = self.test_dir / "monitored"
+        data = doh.config.load()
+        data["directories"][str(monitored)] = {"name": "monitored"}
+        data["exclusions"] = {}
+        doh.config.save(data)
+
+        with patch.object(doh.config, "save", wraps=doh.config.save) as mock_save:
+            assert doh.add_exclusion(monitored) is True
+        assert mock_save.call_count == 1
+
+        result = doh.config.load()
+        assert str(monitored) not in result["directories"]
+        assert str(monitored) in result["exclusions"]
+
     def test_config_error_handling(self):
         """Test handling of config save/load errors"""
         doh = DohCore()
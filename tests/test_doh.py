@@ -87,6 +87,8 @@ class TestDohSystem:
 
         # Verify it's monitored
         assert doh.is_monitored(project_dir)
+        assert doh.get_monitored(project_dir)["threshold"] == 30
+        assert doh.get_monitored(project_dir / "missing") is None
 
         # Check config
         config = doh.config.load()
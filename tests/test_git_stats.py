@@ -7,6 +7,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -58,6 +59,31 @@ class TestGitStats:
         finally:
             shutil.rmtree(non_git_dir)
 
+    def test_is_git_repo_fast_path(self, git_repo):
+        """Test repo roots skip git while subdirectories still ask it"""
+        with patch("subprocess.run") as mock_run:
+            assert GitStats.is_git_repo(git_repo)
+            mock_run.assert_not_called()
+
+        subdir = git_repo / "pkg"
+        subdir.mkdir()
+        assert GitStats.is_git_repo(subdir)
+
+    def test_is_git_repo_uses_pygit2_when_available(self, git_repo):
+        """Test subdirectories are resolved in-process when pygit2 is installed"""
+        subdir = git_repo / "pkg"
+        subdir.mkdir()
+
+        with patch("doh.git_stats.pygit2") as mock_pygit2, patch(
+            "subprocess.run"
+        ) as mock_run:
+            mock_pygit2.discover_repository.return_value = str(git_repo / ".git")
+            assert GitStats.is_git_repo(subdir)
+
+            mock_pygit2.discover_repository.return_value = None
+            assert not GitStats.is_git_repo(subdir)
+            mock_run.assert_not_called()
+
     def test_get_stats_clean_repo(self, git_repo):
         """Test stats for clean repository"""
         stats = GitStats.get_stats(git_repo)
@@ -86,6 +112,79 @@ class TestGitStats:
         assert stats["untracked"] == 1  # New file is untracked
         assert len(stats["file_stats"]) == 2  # Both files in stats
 
+    def test_diff_failure_with_untracked_files(self, git_repo):
+        """Test a failing diff still yields None when it runs alongside counting"""
+        (git_repo / "README.md").write_text("# Changed\n")
+        (git_repo / "untracked.txt").write_text("one\n")
+        error = subprocess.CalledProcessError(128, "git diff")
+
+        with patch.object(GitStats, "_get_numstat", side_effect=error):
+            assert GitStats.get_stats(git_repo) is None
+
+    def test_untracked_only_skips_diff(self, git_repo):
+        """Test the diff is skipped when no tracked file has changed"""
+        (git_repo / "untracked.txt").write_text("one\ntwo\n")
+
+        with patch.object(GitStats, "_get_numstat") as mock_numstat:
+            stats = GitStats.get_stats(git_repo)
+            mock_numstat.assert_not_called()
+
+        assert stats["total_changes"] == 0
+        assert stats["untracked_lines"] == 2
+        assert stats["paths"] == ["untracked.txt"]
+
+    def test_numstat_binary_and_text_changes(self, git_repo):
+        """Test numstat parsing counts binary files without line totals"""
+        (git_repo / "README.md").write_text("# Test Project\nChanged\nAdded\n")
+        (git_repo / "image.bin").write_bytes(b"\x00\x01\x02")
+        subprocess.run(["git", "add", "image.bin"], cwd=git_repo, check=True)
+
+        stats = GitStats.get_stats(git_repo)
+
+        assert stats["files_changed"] == 2
+        assert stats["added"] == 2
+        assert stats["deleted"] == 1
+        by_file = {f["file"]: f for f in stats["file_stats"]}
+        assert by_file["image.bin"]["added"] == 0
+        assert by_file["image.bin"]["deleted"] == 0
+
+    def test_numstat_unicode_and_renamed_paths(self, git_repo):
+        """Test numstat paths stay unquoted and renames report the new name"""
+        (git_repo / "café.txt").write_text("one\n")
+        subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-m", "add"], cwd=git_repo, check=True)
+
+        (git_repo / "café.txt").write_text("one\ntwo\n")
+        subprocess.run(["git", "mv", "README.md", "DOCS.md"], cwd=git_repo, check=True)
+
+        stats = GitStats.get_stats(git_repo)
+
+        files = {f["file"] for f in stats["file_stats"]}
+        assert files == {"café.txt", "DOCS.md"}
+        assert stats["added"] == 1
+
+    def test_paths_cover_everything_to_stage(self, git_repo):
+        """Test stats list modified, deleted, renamed and untracked paths"""
+        (git_repo / "keep.txt").write_text("keep\n")
+        (git_repo / "gone.txt").write_text("gone\n")
+        subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-m", "more"], cwd=git_repo, check=True)
+
+        (git_repo / "keep.txt").write_text("keep\nmore\n")
+        subprocess.run(["git", "rm", "-q", "gone.txt"], cwd=git_repo, check=True)
+        subprocess.run(["git", "mv", "README.md", "DOCS.md"], cwd=git_repo, check=True)
+        (git_repo / "fresh.txt").write_text("fresh\n")
+
+        stats = GitStats.get_stats(git_repo)
+
+        assert sorted(stats["paths"]) == [
+            "DOCS.md",
+            "README.md",
+            "fresh.txt",
+            "gone.txt",
+            "keep.txt",
+        ]
+
     def test_format_file_changes(self, git_repo):
         """Test file change formatting for commit messages"""
         # Create various types of changes
@@ -159,6 +258,30 @@ class TestGitStats:
         assert len(branches) == 1
         assert branches[0]["name"].startswith("doh-auto-commits-")
         assert branches[0]["commit_count"] > 0
+        assert branches[0]["last_commit"].endswith("ago")
+
+    def test_list_temp_branch_names(self, git_repo):
+        """Test the names-only listing matches the detailed one"""
+        assert GitStats.list_temp_branch_names(git_repo) == []
+
+        subprocess.run(
+            ["git", "branch", "doh-auto-commits-20240101-000000"],
+            cwd=git_repo,
+            check=True,
+        )
+        subprocess.run(["git", "branch", "unrelated"], cwd=git_repo, check=True)
+        subprocess.run(
+            ["git", "branch", "doh-auto-commits-20250101-000000"],
+            cwd=git_repo,
+            check=True,
+        )
+
+        names = GitStats.list_temp_branch_names(git_repo)
+        assert names == [
+            "doh-auto-commits-20240101-000000",
+            "doh-auto-commits-20250101-000000",
+        ]
+        assert names == [b["name"] for b in GitStats.list_temp_branches(git_repo)]
 
     def test_switch_to_temp_branch(self, git_repo):
         """Test switching to temp branch"""
@@ -250,6 +373,19 @@ class TestGitStats:
         untracked_stats = [f for f in stats["file_stats"] if f["status"] == "new"]
         assert len(untracked_stats) == 2
 
+    def test_untracked_files_in_subdirectory(self, git_repo):
+        """Test untracked files are scoped and named relative to a subdirectory"""
+        subdir = git_repo / "pkg"
+        (subdir / "nested").mkdir(parents=True)
+        (subdir / "nested" / "mod.txt").write_text("a\nb\n")
+        (git_repo / "outside.txt").write_text("not counted\n")
+
+        stats = GitStats.get_stats(subdir)
+
+        assert stats["untracked"] == 1
+        assert stats["untracked_lines"] == 2
+        assert stats["file_stats"][0]["file"] == "nested/mod.txt"
+
     def test_staged_files_handling(self, git_repo):
         """Test handling of staged files in new repositories"""
         # Create new repo without initial commit
@@ -282,6 +418,28 @@ class TestGitStats:
         finally:
             shutil.rmtree(new_repo)
 
+    def test_staged_files_in_new_repo_subdirectory(self):
+        """Test staged files in a repo without commits are scoped to the directory"""
+        new_repo = Path(tempfile.mkdtemp())
+        try:
+            subprocess.run(
+                ["git", "init"], cwd=new_repo, check=True, capture_output=True
+            )
+            subdir = new_repo / "pkg"
+            subdir.mkdir()
+            (subdir / "inside.txt").write_text("one\ntwo\n")
+            (new_repo / "outside.txt").write_text("skip\n")
+            subprocess.run(["git", "add", "."], cwd=new_repo, check=True)
+
+            stats = GitStats.get_stats(subdir)
+
+            assert stats["files_changed"] == 1
+            assert stats["total_changes"] == 2
+            assert stats["file_stats"][0]["file"] == "inside.txt"
+
+        finally:
+            shutil.rmtree(new_repo)
+
     def test_binary_file_handling(self, git_repo):
         """Test that binary files are handled gracefully"""
         # Create a binary file (simulate with bytes that would cause UnicodeDecodeError)
@@ -295,6 +453,99 @@ class TestGitStats:
         assert stats["untracked"] == 1
         assert stats["untracked_lines"] >= 1  # Binary files count as 1 line minimum
 
+    def test_stats_report_current_branch(self, git_repo):
+        """Test get_stats reports the branch from its status call"""
+        subprocess.run(
+            ["git", "checkout", "-q", "-b", "feature"], cwd=git_repo, check=True
+        )
+        assert GitStats.get_stats(git_repo)["branch"] == "feature"
+
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=git_repo, check=True)
+        assert GitStats.get_stats(git_repo)["branch"] == ""
+
+    def test_dirty_submodule_has_nothing_to_commit(self, git_repo, capsys):
+        """Test a submodule with only worktree edits has nothing to commit"""
+        from doh.git_operations import auto_commit_directory
+
+        sub_src = git_repo.parent / f"{git_repo.name}_sub"
+        subprocess.run(["git", "init", "-q", str(sub_src)], check=True)
+        (sub_src / "file.txt").write_text("one\n")
+        subprocess.run(["git", "add", "."], cwd=sub_src, check=True)
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.email=test@example.com",
+                "-c",
+                "user.name=Test User",
+                "commit",
+                "-q",
+                "-m",
+                "sub",
+            ],
+            cwd=sub_src,
+            check=True,
+        )
+        git_cmd = ["git", "-C", str(git_repo)]
+        try:
+            allow_file = ["-c", "protocol.file.allow=always"]
+            add_sub = ["submodule", "add", "-q", str(sub_src), "sub"]
+            subprocess.run(git_cmd + allow_file + add_sub, check=True)
+            subprocess.run(git_cmd + ["commit", "-qm", "sub"], check=True)
+            (git_repo / "sub" / "file.txt").write_text("one\ntwo\n")
+
+            stats = GitStats.get_stats(git_repo)
+            assert stats["paths"] == ["sub"]
+
+            settings = {"use_temp_branches": False}
+            assert not auto_commit_directory(
+                git_repo, stats, 1, "repo", True, None, settings
+            )
+            assert "repo: No changes to commit" in capsys.readouterr().out
+        finally:
+            shutil.rmtree(sub_src)
+
+    def test_stale_stats_have_nothing_to_commit(self, git_repo, capsys):
+        """Test stats taken before another commit report nothing to commit"""
+        from doh.git_operations import auto_commit_directory
+
+        (git_repo / "README.md").write_text("changed\n")
+        stats = GitStats.get_stats(git_repo)
+        assert stats["paths"] == ["README.md"]
+
+        # Something else commits the change before these stats are used
+        git_cmd = ["git", "-C", str(git_repo)]
+        subprocess.run(git_cmd + ["commit", "-qam", "other"], check=True)
+
+        settings = {"use_temp_branches": False}
+        assert not auto_commit_directory(
+            git_repo, stats, 1, "repo", True, None, settings
+        )
+        assert "repo: No changes to commit" in capsys.readouterr().out
+
+    def test_map_directories_keeps_order(self, git_repo):
+        """Test concurrent stats come back in the order directories were given"""
+        from doh.git_stats import map_directories
+
+        missing = str(git_repo / "missing")
+        paths = [str(git_repo), missing, str(git_repo)]
+
+        results = map_directories(
+            lambda p: GitStats.get_stats(Path(p)) if p != missing else None, paths
+        )
+
+        assert [r is not None for r in results] == [True, False, True]
+        assert map_directories(str.upper, []) == []
+
+        # Results still come back in input order when streamed to a callback
+        seen = []
+        assert map_directories(str.upper, ["a", "b", "c"], seen.append) == [
+            "A",
+            "B",
+            "C",
+        ]
+        assert sorted(seen) == ["A", "B", "C"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
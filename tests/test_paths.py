@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test suite for DOH filesystem helpers
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from doh.paths import existing_paths
+
+
+class TestExistingPaths:
+    """Test batched existence checks"""
+
+    def test_siblings_share_one_scandir(self):
+        """Test siblings are resolved from a single listing of their parent"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a").mkdir()
+            (root / "b").mkdir()
+            paths = [str(root / "a"), str(root / "b"), str(root / "missing")]
+
+            with patch("os.path.exists", return_value=False) as mock_exists:
+                result = existing_paths(paths)
+                # Only the name missing from the listing is checked on its own
+                mock_exists.assert_called_once_with(str(root / "missing"))
+
+            assert result == {str(root / "a"), str(root / "b")}
+
+    def test_listing_mismatches_fall_back_to_exists(self):
+        """Test case-mismatched names and dangling symlinks match exists()"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "Project").mkdir()
+            (root / "dangling").symlink_to(root / "nowhere")
+            (root / "file.txt").write_text("")
+            paths = [
+                str(root / "project"),
+                str(root / "dangling"),
+                str(root / "file.txt"),
+            ]
+
+            expected = {p for p in paths if os.path.exists(p)}
+            assert existing_paths(paths) == expected
+
+    def test_single_child_and_unreadable_parent(self):
+        """Test lone entries and missing parents fall back to stat"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "solo").mkdir()
+            paths = [
+                str(root / "solo"),
+                str(root / "gone" / "x"),
+                str(root / "gone" / "y"),
+            ]
+
+            assert existing_paths(paths) == {str(root / "solo")}
+
+    def test_empty_input(self):
+        """Test no paths gives an empty set"""
+        assert existing_paths([]) == set()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])